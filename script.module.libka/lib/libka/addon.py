@@ -1,5 +1,4 @@
 import sys
-from contextlib import contextmanager
 from datetime import datetime
 from typing import (
     overload,
@@ -10,7 +9,7 @@ from .base import BaseAddonMixin, LIBKA_ID
 from .utils import parse_url
 from .settings import Settings
 from .search import Search
-from .logs import log
+from .logs import log, reset_debug_enabled
 from .resources import Resources
 from .storage import Storage
 from .folder import AddonDirectory
@@ -35,6 +34,33 @@ class Request:
         self.params = self.url.query
 
 
+class _DirectoryContext:
+    """
+    Helper. `Addon.directory()` with-statement.
+
+    Closes directory with `success` flag, no extra generator frame on the happy path.
+    """
+
+    __slots__ = ('directory', 'safe')
+
+    def __init__(self, directory, *, safe=False):
+        self.directory = directory
+        self.safe = safe
+
+    def __enter__(self):
+        return self.directory
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.directory.close(True)
+        elif issubclass(exc_type, Exception):
+            self.directory.close(False)
+            if self.safe:
+                log.error(f'Build directory exception: {exc_val!r}')
+                return True
+        return False
+
+
 class AddonMixin(BaseAddonMixin):
     """
     Abstract Libka Addon.
@@ -49,22 +75,21 @@ class AddonMixin(BaseAddonMixin):
     Created router (if router is None) handle global @entry decorators.
     """
 
-    settings = subobject()
-
     def __init__(self, *args, **kwargs):
         addon_id = kwargs.pop('id', None)
         super().__init__(*args, **kwargs)
+        # Kodi could reuse interpreter (reuselanguageinvoker), debug logging could be changed since last run
+        reset_debug_enabled()
         now = datetime.now()
         #: Timezone UTC offset
         self.tz_offset = now - datetime.utcfromtimestamp(now.timestamp())
         #: Names for paramteres to encode raw Python data, don't use it.
         self.encoded_keys = {'_'}
-        #: XBMC (Kodi) Addon
-        self.xbmc_addon = XbmcAddon() if addon_id is None else XbmcAddon(addon_id)
-        #: Addon ID (unique name)
-        self.id = self.xbmc_addon.getAddonInfo('id')
-        #: Addon settings.
-        self.settings = Settings(addon=self, default=None)
+        #: XBMC (Kodi) Addon (lazy load).
+        self._xbmc_addon: XbmcAddon = None
+        self._xbmc_addon_id: str = addon_id
+        #: Addon ID (unique name), lazy load if None.
+        self._id: str = addon_id
         #: Default userdata
         self.user_data = Storage(addon=self)
         #: User defined colors used in "[COLOR :NAME]...[/COLOR]"
@@ -75,8 +100,8 @@ class AddonMixin(BaseAddonMixin):
         #: User defined styles for text / label formatting.
         self.styles = adict({
         })
-        #: Resources
-        self.resources = Resources(self)
+        #: Resources (lazy load).
+        self._resources: Resources = None
         #: Default text formatter.
         self.formatter = SafeFormatter(extended=True, styles=self.styles,
                                        stylize=StylizeSettings(colors=self.get_color))
@@ -84,6 +109,44 @@ class AddonMixin(BaseAddonMixin):
     def __repr__(self):
         return f'{self.__class__.__name__}({self.id!r})'
 
+    @property
+    def xbmc_addon(self) -> XbmcAddon:
+        """XBMC (Kodi) Addon."""
+        if self._xbmc_addon is None:
+            self._xbmc_addon = XbmcAddon() if self._xbmc_addon_id is None else XbmcAddon(self._xbmc_addon_id)
+        return self._xbmc_addon
+
+    @xbmc_addon.setter
+    def xbmc_addon(self, xbmc_addon: XbmcAddon) -> None:
+        self._xbmc_addon = xbmc_addon
+
+    @property
+    def id(self) -> str:
+        """Addon ID (unique name)."""
+        if self._id is None:
+            self._id = self.xbmc_addon.getAddonInfo('id')
+        return self._id
+
+    @id.setter
+    def id(self, id: str) -> None:
+        self._id = id
+
+    @subobject
+    def settings(self) -> Settings:
+        """Addon settings."""
+        return Settings(addon=self, default=None)
+
+    @property
+    def resources(self) -> Resources:
+        """Resources."""
+        if self._resources is None:
+            self._resources = Resources(self)
+        return self._resources
+
+    @resources.setter
+    def resources(self, resources: Resources) -> None:
+        self._resources = resources
+
     @property
     def media(self):
         """Media resources."""
@@ -146,10 +209,14 @@ class Addon(MenuMixin, AddonMixin):
         super().__init__()
         if argv is None:
             argv = sys.argv
-        if len(argv) < 3 or (argv[1] != '-1' and not argv[1].isdigit()) or (argv[2] and argv[2][:1] != '?'):
-            raise TypeError('Incorrect addon args: %s' % argv)
-        #: Addon handle (integer).
-        self.handle = int(argv[1])
+        try:
+            #: Addon handle (integer).
+            self.handle = int(argv[1])
+            query = argv[2]
+            if query and query[0] != '?':
+                raise ValueError(query)
+        except (IndexError, ValueError):
+            raise TypeError('Incorrect addon args: %s' % argv) from None
         #: Kodi request to plugin://...
         self.req = Request(argv[0] + argv[2], raw_keys=self.encoded_keys)
         #: Addon ID (unique name)
@@ -167,6 +234,10 @@ class Addon(MenuMixin, AddonMixin):
         self.search = Search(self)
         #: Libka itself
         self._libka = None
+        #: Resolved root (home) entry method, see ROOT_ENTRY.
+        root_names = (self.ROOT_ENTRY,) if isinstance(self.ROOT_ENTRY, str) else self.ROOT_ENTRY
+        self._resolved_root = next((method for method in (getattr(self, name, None) for name in root_names)
+                                    if callable(method)), None)
 
     def __repr__(self):
         return f'{self.__class__.__name__}({self.id!r}, {str(self.req.url)!r})'
@@ -204,9 +275,8 @@ class Addon(MenuMixin, AddonMixin):
         Dispatcher. Call pointed method with request arguments.
         """
         if root is None:
-            if callable(getattr(self, 'home', None)):
-                root = self.home
-            elif hasattr(self, 'MENU') and callable(getattr(self, 'menu', None)):
+            root = self._resolved_root
+            if root is None and hasattr(self, 'MENU') and callable(getattr(self, 'menu', None)):
                 root = self.menu
         if missing is None and callable(getattr(self, 'missing', None)):
             missing = self.missing
@@ -223,21 +293,9 @@ class Addon(MenuMixin, AddonMixin):
             self.user_data.save()
         return res
 
-    @contextmanager
     def directory(self, *, safe: bool = False, **kwargs):
-        kd = AddonDirectory(addon=self, **kwargs)
-        try:
-            yield kd
-        except Exception as exc:
-            kd.close(False)
-            if safe:
-                log.error(f'Build directory exception: {exc!r}')
-            else:
-                raise
-        else:
-            kd.close(True)
-        finally:
-            pass
+        """Directory context manager. Close the directory (with success flag) on exit."""
+        return _DirectoryContext(AddonDirectory(addon=self, **kwargs), safe=safe)
 
     def play_failed(self):
         """Notice, that play failed."""
@@ -41,6 +41,8 @@ def sleep(msec: int) -> None:
 @wraps_class(xbmcgui.ListItem)
 class ListItem(xbmcgui.ListItem):
 
+    __slots__ = ('_libka_x_label', '_libka_x_menu')
+
     def __init__(self, label: str = "",
                  label2: str = "",
                  path: str = "",
@@ -82,11 +84,16 @@ def addDirectoryItems(handle: int,
                       totalItems: int = 0) -> bool:
     def fmt(url, item, folder):
         folder = ", '/'" if folder else ''
-        menu = getattr(item, 'self._libka_x_menu', '')
+        if isinstance(item, ListItem):
+            label = item._libka_x_label
+            menu = getattr(item, '_libka_x_menu', '')
+        else:
+            label = item.getLabel()
+            menu = ''
         if menu:
-            menu = ','.join('\n      ({label!r}, {action!r})' for label, action in menu)
+            menu = ','.join(f'\n      ({title!r}, {action!r})' for title, action in menu)
             menu = f', menu=[\n{menu}\n    ]'
-        return f'  ({url!r}, {item.getLabel()!r}{folder}{menu}),'
+        return f'  ({url!r}, {label!r}{folder}{menu}),'
 
     klog.info('addDirectoryItems(\n{}\n)'.format('\n'.join(fmt(*item) for item in items)))
     return xbmcplugin_addDirectoryItems(handle=handle, items=items, totalItems=totalItems)
@@ -106,29 +113,49 @@ xbmc_log = xbmc.log
 xbmc_sleep = xbmc.sleep
 
 
+def _console_on() -> None:
+    xbmc.log = log
+
+
+def _console_off() -> None:
+    xbmc.log = xbmc_log
+
+
+def _items_on() -> None:
+    xbmcplugin.addDirectoryItem = addDirectoryItem
+    xbmcplugin.addDirectoryItems = addDirectoryItems
+
+
+def _items_off() -> None:
+    xbmcplugin.addDirectoryItem = xbmcplugin_addDirectoryItem
+    xbmcplugin.addDirectoryItems = xbmcplugin_addDirectoryItems
+
+
+def _fake_on() -> None:
+    xbmcgui.ListItem = ListItem
+    xbmcaddon.Addon.getLocalizedString = getLocalizedString
+    xbmc.sleep = sleep
+
+
+def _fake_off() -> None:
+    xbmcgui.ListItem = xbmcgui_ListItem
+    xbmcaddon.Addon.getLocalizedString = xbmcaddon_Addon_getLocalizedString
+    xbmc.sleep = xbmc_sleep
+
+
+#: Debug toggles (on, off) in `xbmc_debug()` arguments order: console, items, fake.
+_TOGGLES = (
+    (_console_on, _console_off),
+    (_items_on, _items_off),
+    (_fake_on, _fake_off),
+)
+
+
 def xbmc_debug(console: bool = None, items: bool = None,
                fake: bool = None) -> None:
     """
-    Switch on / off debug stuff.
+    Switch on / off debug stuff. None means "leave as is".
     """
-
-    if console is True:
-        xbmc.log = log
-    elif console is False:
-        xbmc.log = xbmc_log
-
-    if items is True:
-        xbmcplugin.addDirectoryItem = addDirectoryItem
-        xbmcplugin.addDirectoryItems = addDirectoryItems
-    elif items is False:
-        xbmcplugin.addDirectoryItem = xbmcplugin_addDirectoryItem
-        xbmcplugin.addDirectoryItems = xbmcplugin_addDirectoryItems
-
-    if fake is True:
-        xbmcgui.ListItem = ListItem
-        xbmcaddon.Addon.getLocalizedString = getLocalizedString
-        xbmc.sleep = sleep
-    elif fake is False:
-        xbmcgui.ListItem = xbmcgui_ListItem
-        xbmcaddon.Addon.getLocalizedString = xbmcaddon_Addon_getLocalizedString
-        xbmc.sleep = xbmc_sleep
+    for flag, (on, off) in zip((console, items, fake), _TOGGLES):
+        if flag is not None:
+            (on if flag else off)()
@@ -1,15 +1,59 @@
-import re
 from collections import namedtuple
 from collections.abc import Sequence, Mapping
 from contextlib import contextmanager
+from functools import lru_cache
+from sys import intern
 from .tools import setdefaultx
 from .kodi import version_info as kodi_ver
-from .format import safefmt
-from .logs import log
+from .format import SafeFormatter
+from .logs import flog
+from .routing import Call
 import xbmcgui
 import xbmcplugin
 
 
+#: Kodi sort methods by lower case name (without "SORT_METHOD_").
+_SORT_METHODS = {name[12:].lower(): getattr(xbmcplugin, name)
+                 for name in dir(xbmcplugin) if name.startswith('SORT_METHOD_')}
+_SORT_METHODS.setdefault('year', _SORT_METHODS.get('video_year'))
+#: Kodi year sort method (older Kodi has SORT_METHOD_VIDEO_YEAR only).
+SORT_METHOD_YEAR = _SORT_METHODS['year']
+#: Kodi ListItem.isFolder() is available (since Kodi 20).
+_KODI_GE_20 = kodi_ver >= (20,)
+#: Sort method name normalization: "Video Year" -> "video_year".
+_SORT_NAME_TRANS = str.maketrans(' ABCDEFGHIJKLMNOPQRSTUVWXYZ', '_abcdefghijklmnopqrstuvwxyz')
+
+
+def _get_default_addon():
+    """Helper. Returns default addon: module `addon` if set or the current one (resolved on every call)."""
+    return globals().get('addon') or Call.addon
+
+
+@lru_cache(maxsize=128)
+def _parse_sort(spec):
+    """
+    Helper. Parse single sort command "method|labelMask|label2Mask" (masks are optional).
+
+    Returns (method, labelMask, label2Mask), where method is Kodi sort method or '' or 'auto' to process later.
+    """
+    method, _, mask2 = spec.partition('|')
+    mask1, sep1, mask2 = mask2.rpartition('|')
+    if not sep1:
+        mask1 = '%L'
+    if method not in ('', 'auto'):
+        try:
+            method = _SORT_METHODS[method.translate(_SORT_NAME_TRANS)]
+        except KeyError:
+            raise AttributeError(f'Unknown sort method {method!r}') from None
+    return method, mask1 or None, mask2 or None
+
+
+@lru_cache(maxsize=32)
+def _split_sort(sort):
+    """Helper. Split sort commands (separated by semicolon)."""
+    return tuple(s.strip() for s in sort.split(';'))
+
+
 class Cmp:
     """Helper. Object to compare values without TypeError exception."""
 
@@ -38,17 +82,69 @@ class Cmp:
     #     return False
 
 
+class _Reversed:
+    """Helper. Reversed order sort key (for not numeric values)."""
+
+    __slots__ = ('value', )
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    __hash__ = None
+
+
+def _ordered(value):
+    """Helper. True if `value` type supports ordering (checked once per sort field)."""
+    try:
+        value < value
+    except TypeError:
+        return False
+    return True
+
+
+def _sort_keys(values, *, reverse=False):
+    """
+    Helper. Make plain sort keys for `values` (like `Cmp` does, but once per value).
+
+    Empty values are first (last if `reverse`). If values have mixed types or not ordered type (like dict),
+    all are compared as `str`. Decided once (by types), keys are compared directly.
+    """
+    kinds = {float if isinstance(v, (int, float)) else type(v) for v in values if v}
+    if len(kinds) > 1 or (kinds and not _ordered(next(v for v in values if v))):
+        values = [str(v) if v else v for v in values]
+        kinds = {str}
+    if not reverse:
+        return [(1, v) if v else (0, '') for v in values]
+    if kinds == {float}:
+        return [(0, -v) if v else (1, 0) for v in values]
+    return [(0, _Reversed(v)) if v else (1, None) for v in values]
+
+
 class ListItem:
     """
     Tiny xbmcgui.ListItem wrapper to keep URL and is_folder flag.
     """
 
+    __slots__ = ('_libka_kodi', '_libka_init', '_libka_url', '_libka_folder', 'type', '_info', '_props', '_art',
+                 'sort_key', 'custom', '_menu', '_addon', '_info_dirty', '_props_dirty')
+
     def __init__(self, name, *, url=None, folder=None, type=None, offscreen=True, sort_key=None, custom=None,
                  addon=None):
         if isinstance(name, xbmcgui.ListItem):
-            self._libka_item = name
+            self._libka_kodi = name
+            self._libka_init = None
         else:
-            self._libka_item = xbmcgui.ListItem(name, offscreen=offscreen)
+            # Kodi ListItem is created on first use, keep label and offscreen flag
+            self._libka_kodi = None
+            self._libka_init = (name, offscreen)
+        #: Art set before Kodi ListItem is created.
+        self._art = None
         self._libka_url = url
         self._libka_folder = folder
         self.type = type
@@ -58,20 +154,79 @@ class ListItem:
         self.custom = custom
         self._menu = None
         self._addon = addon
-        if self.type is not None:
-            self._libka_item.setInfo(self.type, self._info)
+        #: Info labels are changed and not applied to Kodi ListItem yet.
+        self._info_dirty = self.type is not None
+        #: Properties are changed and not applied to Kodi ListItem yet.
+        self._props_dirty = False
 
     def __repr__(self):
-        return 'ListItem(%r)' % self._libka_item
+        return f'ListItem({self._libka_item!r})'
 
     def __getattr__(self, key):
         return getattr(self._libka_item, key)
 
+    @property
+    def _libka_item(self):
+        """Kodi ListItem, created on demand with label and art set so far."""
+        item = self._libka_kodi
+        if item is None:
+            label, offscreen = self._libka_init
+            item = self._libka_kodi = xbmcgui.ListItem(label, offscreen=offscreen)
+            if self._art is not None:
+                item.setArt(self._art)
+                self._art = None
+        return item
+
+    def getLabel(self):
+        """See Kodi ListItem.getLabel()."""
+        if self._libka_kodi is None:
+            return self._libka_init[0]
+        return self._libka_kodi.getLabel()
+
+    def setLabel(self, label):
+        """See Kodi ListItem.setLabel()."""
+        if self._libka_kodi is None:
+            self._libka_init = (label, self._libka_init[1])
+        else:
+            self._libka_kodi.setLabel(label)
+
+    def setArt(self, values):
+        """See Kodi ListItem.setArt()."""
+        if self._libka_kodi is None:
+            if self._art is None:
+                self._art = dict(values)
+            else:
+                self._art.update(values)
+        else:
+            self._libka_kodi.setArt(values)
+
     def __call__(self):
         """Execute item, apply all virtual settings into Kodi ListItem."""
+        self.flush_info()
+        self.flush_properties()
         if self._menu is not None:
             self._libka_item.addContextMenuItems(self._menu)
 
+    def flush_info(self):
+        """
+        Apply info labels into Kodi ListItem (once, only if changed).
+
+        Info setters change only libka item, it is called automatically when item is added to directory.
+        """
+        if self._info_dirty and self.type is not None:
+            self._libka_item.setInfo(self.type, self._info)
+            self._info_dirty = False
+
+    def flush_properties(self):
+        """
+        Apply properties into Kodi ListItem (once, only if changed).
+
+        Property setters change only libka item, it is called automatically when item is added to directory.
+        """
+        if self._props_dirty:
+            self._libka_item.setProperties(self._props)
+            self._props_dirty = False
+
     @property
     def mode(self):
         return
@@ -119,18 +274,18 @@ class ListItem:
             self._info.update(info)
         else:
             self._info[info] = value
-        self._libka_item.setInfo(self.type, self._info)
+        self._info_dirty = True
 
     def setInfo(self, type, infoLabels):
         """See Kodi ListItem.setInfo()."""
         if self.type is None:
             self.type = type
         if type != self.type:
-            raise ValueError('Type mismatch %r != %r' % (self.type, type))
+            raise ValueError(f'Type mismatch {self.type!r} != {type!r}')
         if self.type is None:
             raise TypeError('setInfo: type is None')
         self._info.update(infoLabels)
-        self._libka_item.setInfo(self.type, self._info)
+        self._info_dirty = True
 
     @property
     def title(self):
@@ -139,17 +294,22 @@ class ListItem:
     @title.setter
     def title(self, title):
         self._info['title'] = title
-        self._libka_item.setInfo(self.type, self._info)
+        self._info_dirty = True
 
     def setProperties(self, values):
         """See Kodi ListItem.setProperties()."""
         self._props.update(values)
-        self._libka_item.setProperties(values)
+        self._props_dirty = True
 
     def setProperty(self, key, value):
         """See Kodi ListItem.setProperty()."""
         self._props[key] = value
-        self._libka_item.setProperty(key, value)
+        self._props_dirty = True
+
+    def getProperty(self, key):
+        """See Kodi ListItem.getProperty()."""
+        self.flush_properties()
+        return self._libka_item.getProperty(key)
 
     def get_property(self, key):
         """Get set property."""
@@ -174,7 +334,8 @@ Sort = namedtuple('Sort', 'method labelMask label2Mask')
 Sort.__new__.__defaults__ = (None, None)
 Sort.auto = 'auto'
 
-Item = namedtuple('Item', 'item endpoint folder')
+#: Directory item. `get_prop` is item property getter (None for a title only).
+Item = namedtuple('Item', 'item endpoint folder get_prop')
 
 #: Resolved xbmcplugin.addDirectoryItems item.
 DirectoryItem = namedtuple('DirectoryItem', 'url listitem is_folder')
@@ -268,12 +429,29 @@ class AddonDirectory:
     See: xbmcgui.ListItem, xbmcplugin.addDirectoryItem, xbmcplugin.endOfDirectory.
     """
 
-    _RE_ISORT_SPLIT = re.compile(r'[,;]')
+    __slots__ = ('addon', 'router', 'item_list', 'view', 'type', 'image', 'fanart', 'format', 'style',
+                 '_label_used', '_label2_used', 'sort_list', '_initial_sort', 'isort', 'cache', 'update', 'offscreen',
+                 '_next_sort_key', '_menu', '_next_item_menu', '_default_art', '_formatter')
+
+    #: Internal sort keys separators (both are converted to comma).
+    _ISORT_TRANS = str.maketrans(';', ',')
+
+    #: Auto sort methods: (Kodi-sort-method, set-of-info-keys).
+    _AUTO_SORT_METHODS = (
+        (xbmcplugin.SORT_METHOD_TITLE,    frozenset(('title',))),
+        (SORT_METHOD_YEAR,                frozenset(('year', 'aired'))),
+        (xbmcplugin.SORT_METHOD_DURATION, frozenset(('duration',))),
+        (xbmcplugin.SORT_METHOD_GENRE,    frozenset(('genre',))),
+    )
+    #: All info keys used by auto sort methods.
+    _AUTO_SORT_KEYS = frozenset(key for _, keys in _AUTO_SORT_METHODS for key in keys)
+    #: Art names taken from addon "default/" images if item has no own image.
+    _DEFAULT_ART_NAMES = ('icon', 'landscape', 'poster', 'banner', 'clearlogo', 'keyart')
 
     def __init__(self, *, addon=None, view='videos', sort=None, type='video', image=None, fanart=None,
                  format=None, style=None, isort=None, cache=False, update=False, offscreen=True, menu=None):
         if addon is None:
-            addon = globals()['addon']
+            addon = _get_default_addon()
         self.addon = addon
         self.router = self.addon.router
         self.item_list = []
@@ -288,12 +466,12 @@ class AddonDirectory:
         self.sort_list = []
         self._initial_sort = sort
         if isinstance(sort, str):
-            sort = [s.strip() for s in sort.split(';')]
+            sort = _split_sort(sort)
         if sort is not None and not isinstance(sort, bool):
             for s in sort:
                 self._add_sort(s)
         if isinstance(isort, str):
-            self.isort = [s.strip() for s in self._RE_ISORT_SPLIT.split(isort)]
+            self.isort = [s.strip() for s in isort.translate(self._ISORT_TRANS).split(',')]
         elif isinstance(isort, Sequence):
             self.isort = list(isort)
         else:
@@ -306,6 +484,8 @@ class AddonDirectory:
             menu = AddonContextMenu(menu, addon=self.addon)
         self._menu = menu
         self._next_item_menu = None
+        self._default_art = None
+        self._formatter = None
         handler = getattr(self.addon, 'on_directory_enter', None)
         if handler is not None:
             handler(self)
@@ -338,24 +518,50 @@ class AddonDirectory:
                         it.item.set_info('code', it.item.getLabel2())
         # internal sort
         if self.isort:
-            for srt in reversed(self.isort):
+            items = self.item_list
+            libka_items = [it.item if isinstance(it.item, ListItem) else None for it in items]
+            fields = []
+            for srt in self.isort:
                 reverse = False
                 if srt.startswith('-'):
                     srt = srt[1:]
                     reverse = True
                 elif srt.startswith('+'):
                     srt = srt[1:]
-                self.item_list.sort(key=lambda it: (Cmp(it.item.get(srt))
-                                                    if isinstance(it.item, ListItem)
-                                                    else Cmp()),
-                                    reverse=reverse)
+                srt = intern(srt)  # parsed name, info keys are (interned) literals
+                if srt == 'label':
+                    values = [None if item is None else item.getLabel() for item in libka_items]
+                else:
+                    values = [None if item is None else item._info.get(srt) for item in libka_items]
+                fields.append((values, reverse))
+            # single stable sort of indexes with multi-field keys, items are gathered once at the end
+            try:
+                indices = sorted(range(len(items)), key=self._isort_keys(fields).__getitem__)
+            except TypeError:
+                # values of the same type are not comparable (ex. lists with mixed types), compare as str
+                fields = [([str(v) if v else v for v in values], reverse) for values, reverse in fields]
+                indices = sorted(range(len(items)), key=self._isort_keys(fields).__getitem__)
+            self.item_list[:] = [items[i] for i in indices]
         # ... always respect "SpecialSort" property, even wth SORT_METHOD_UNSORTED
         spec_sort = {'top': -1, 'bottom': 1}
-        self.item_list.sort(key=lambda it: spec_sort.get(((it.item.get_property
-                                                          if isinstance(it.item, ListItem)
-                                                          else it.item.getProperty)('SpecialSort') or '').lower(), 0))
+        keys = []
+        for it in self.item_list:
+            position = None if it.get_prop is None else it.get_prop('SpecialSort')
+            keys.append(spec_sort.get(position.lower(), 0) if position else 0)
+        if any(keys):
+            items = self.item_list
+            self.item_list[:] = [items[i] for i in sorted(range(len(items)), key=keys.__getitem__)]
         # add all items
-        xitems = [self._prepare(*it) for it in self.item_list]
+        xitems = []
+        append, prepare = xitems.append, self._prepare
+        for item, endpoint, folder, _ in self.item_list:
+            if item.__class__ is ListItem and endpoint is None:
+                # fast path: our list item with ready URL
+                item()
+                append(DirectoryItem(item._libka_url, item._libka_item,
+                                     item._libka_folder if folder is None else folder))
+            else:
+                append(prepare(item, endpoint, folder))
         xbmcplugin.addDirectoryItems(self.addon.handle, xitems, len(xitems))
         # add sort methods
         if self._initial_sort is True:
@@ -368,7 +574,7 @@ class AddonDirectory:
                     self.sort_list = [Sort('auto')]
             for sort in self.sort_list:
                 if sort.method == '':
-                    method = xbmcplugin.SORT_METHOD_UNSORTED
+                    method = _SORT_METHODS['unsorted']
                     add_sort_method(sortMethod=method, labelMask=sort.labelMask, label2Mask=sort.label2Mask)
                 elif sort.method == 'auto':
                     for method in self._find_auto_sort():
@@ -382,6 +588,23 @@ class AddonDirectory:
         xbmcplugin.endOfDirectory(self.addon.handle, succeeded=success,
                                   updateListing=self.update, cacheToDisc=self.cache)
 
+    @staticmethod
+    def _isort_keys(fields):
+        """Helper. Make internal sort keys for all items from (values, reverse) fields."""
+        if len(fields) == 1:
+            # single field, no key tuples needed
+            values, reverse = fields[0]
+            return _sort_keys(values, reverse=reverse)
+        return list(zip(*(_sort_keys(values, reverse=reverse) for values, reverse in fields)))
+
+    @property
+    def default_art(self):
+        """Addon default art images (existing only, as str), resolved once per directory."""
+        if self._default_art is None:
+            images = ((iname, self.addon.media.image(f'default/{iname}')) for iname in self._DEFAULT_ART_NAMES)
+            self._default_art = {iname: str(image) for iname, image in images if image is not None}
+        return self._default_art
+
     def sort_items(self, *, key=None, reverse=False):
         """
         Sort items **before** `AddonDirectory.close()`.
@@ -399,33 +622,35 @@ class AddonDirectory:
 
     def _find_auto_sort(self):
         """Helper. Sort method auto generator."""
-        try:
-            SORT_METHOD_YEAR = xbmcplugin.SORT_METHOD_YEAR
-        except AttributeError:
-            SORT_METHOD_YEAR = xbmcplugin.SORT_METHOD_VIDEO_YEAR
         # "auto" should not generate SORT_METHOD_UNSORTED, it is easy to get directly.
         # yield xbmcplugin.SORT_METHOD_UNSORTED
-        for method, keys in {
-                # Kodi-sort-method:              (list-of-info-keys)
-                xbmcplugin.SORT_METHOD_TITLE:    ('title',),
-                SORT_METHOD_YEAR:                ('year', 'aired'),
-                xbmcplugin.SORT_METHOD_DURATION: ('duration',),
-                xbmcplugin.SORT_METHOD_GENRE:    ('genre',),
-        }.items():
-            if any(it.item.get(key)
-                   for it in self.item_list if isinstance(it.item, ListItem)
-                   for key in keys):
+        # single pass: remove info keys with any value from still missing keys
+        missing = set(self._AUTO_SORT_KEYS)
+        for it in self.item_list:
+            if isinstance(it.item, ListItem):
+                info = it.item._info
+                found = [key for key in missing if info.get(key)]
+                if found:
+                    missing.difference_update(found)
+                    if not missing:
+                        break
+        present = self._AUTO_SORT_KEYS - missing
+        for method, keys in self._AUTO_SORT_METHODS:
+            if not present.isdisjoint(keys):
                 yield method
 
     def _add_sort(self, data):
         """Helper. Add sort method, `data` is str, dict or tuple."""
-        if data == 'auto':                  # auto_sort()
-            self.add_sort(data)
-        elif isinstance(data, Sort):        # add_sort(Sort(...))
+        cls = data.__class__
+        # fast path, concrete types
+        if cls is str or cls is Sort or cls is int:  # add_sort("method"), add_sort(Sort(...)), add_sort(SORT_METHOD)
             self.add_sort(data)
-        elif isinstance(data, int):         # add_sort(xbmcplugin.SORT_METHOD_method)
-            self.add_sort(data)
-        elif isinstance(data, str):         # add_sort("method") or add_sort("method|label2Mask")
+        elif cls is dict:                   # add_sort(method=..., labelMask=..., label2Mask=...)
+            self.add_sort(**data)
+        elif cls is tuple or cls is list:   # add_sort(method, labelMask, label2Mask)
+            self.add_sort(*data)
+        # generic types
+        elif isinstance(data, (Sort, int, str)):
             self.add_sort(data)
         elif isinstance(data, Mapping):     # add_sort(method=..., labelMask=..., label2Mask=...)
             self.add_sort(**data)
@@ -438,21 +663,11 @@ class AddonDirectory:
             self.sort_list.append(method)
         else:
             if isinstance(method, str):
-                method, sep2, mask2 = method.partition('|')
-                mask1, sep1, mask2 = mask2.rpartition('|')
-                if labelMask is None and mask1:
+                method, mask1, mask2 = _parse_sort(method)
+                if labelMask is None:
                     labelMask = mask1
-                elif not sep1:
-                    labelMask = '%L'
-                if label2Mask is None and mask2:
+                if label2Mask is None:
                     label2Mask = mask2
-                if method in ('', 'auto'):
-                    # to process later
-                    self.sort_list.append(Sort(method, labelMask, label2Mask))
-                    return
-                elif method == 'year' and not hasattr(xbmcplugin, 'SORT_METHOD_YEAR'):
-                    method = 'video_year'
-                method = getattr(xbmcplugin, 'SORT_METHOD_%s' % method.replace(' ', '_').upper())
             self.sort_list.append(Sort(method, labelMask, label2Mask))
 
     # @trace
@@ -535,7 +750,6 @@ class AddonDirectory:
 
         In the case of `label` or *name* default label mask `|%L|` is used if no `sort` is defined.
         """
-        # log.error('>>> ENTER...')  # DEBUG
         if offscreen is None:
             offscreen = self.offscreen
         if type is None:
@@ -545,7 +759,7 @@ class AddonDirectory:
         if sort_key is None:
             sort_key = self._next_sort_key
         name = _name
-        log.xdebug(f'NEW: {label=!r}, {endpoint=!r}, {name=!r}')
+        flog.xdebug('NEW: label={label!r}, endpoint={endpoint!r}, name={name!r}')
         if label is not None and endpoint is None:
             name, endpoint = label, name
         if title is None and info and info.get('title'):
@@ -554,7 +768,7 @@ class AddonDirectory:
             _title = title
         entry = self.router.mkentry(name, endpoint, title=_title, style=style)
         label = entry.label
-        log.xdebug(f'new: {entry=!r}')
+        flog.xdebug('new: entry={entry!r}')
         if label is None:
             if entry.title is None:
                 label = str(entry.url)
@@ -564,8 +778,6 @@ class AddonDirectory:
             self._label_used = True
         item = ListItem(label, url=entry.url, folder=folder, type=type, offscreen=offscreen,
                         sort_key=sort_key, custom=custom)
-        if folder is True:
-            item.setIsFolder(folder)
         if label2 is not None:
             item.setLabel2(label2)
             self._label2_used = True
@@ -580,8 +792,10 @@ class AddonDirectory:
         if menu is not None:
             item.menu = AddonContextMenu(self._menu, self._next_item_menu, menu, addon=self.addon)
         self._next_item_menu = None
-        # info
-        info = {} if info is None else dict(info)
+        # info, build directly in the item (applied to Kodi once, on item execute)
+        if info:
+            item._info.update(info)
+        info = item._info
         if entry.title is not None:
             info.setdefault('title', entry.title)
         if descr is not None:
@@ -592,21 +806,27 @@ class AddonDirectory:
             info['season'] = season
         if episode is not None:
             info['episode'] = episode
-        item.setInfo(type, info or {})
         # art / images
         art = {} if art is None else dict(art)
         setdefaultx(art, 'icon', image, self.image)
         setdefaultx(art, 'fanart', fanart, self.fanart)
         setdefaultx(art, 'thumb', thumb)
-        if not (set(art) - {'fanart', 'thumb'}):
-            # missing image, take defaults
-            for iname in ('icon', 'landscape', 'poster', 'banner', 'clearlogo', 'keyart'):
-                image = self.addon.media.image('default/%s' % iname)
-                if image is not None:
-                    art.setdefault(iname, image)
+        for k, v in art.items():
+            if v.__class__ is str:  # `type` is an argument here
+                if v[:2] == '//':
+                    art[k] = 'https:' + v
+            else:
+                art[k] = str(v)
+        has_main = len(art) > ('fanart' in art) + ('thumb' in art)  # any image except fanart and thumb
+        if not has_main:
+            # missing image, take defaults (already fixed strings)
+            for iname, image in self.default_art.items():
+                art.setdefault(iname, image)
             # setdefaultx(art, 'icon', addon_icon)
-        art = {k: 'https:' + v if isinstance(v, str) and v.startswith('//') else str(v) for k, v in art.items()}
-        item.setArt(art)
+        if item._libka_kodi is None and item._art is None:
+            item._art = art  # `art` is our own copy already, pass it to Kodi ListItem on creation
+        else:
+            item.setArt(art)
         # serial
         if season is not None:
             if not isinstance(season, str) and isinstance(season, Sequence):
@@ -617,16 +837,26 @@ class AddonDirectory:
         if format is None:
             format = self.format
         if format is not None:
-            if entry.title is not None:
-                label.title = safefmt(format, entry.title, **info)
-            label = safefmt(format, label, **info)
+            if self._formatter is None:
+                # safe formatter for whole directory (format strings are parsed once by parse_format())
+                self._formatter = SafeFormatter()
+            title = None if entry.title is None else self._formatter.vformat(format, (entry.title,), info)
+            label = self._formatter.vformat(format, (label,), info)
+            if title is not None:
+                item.title = title
         label = self.addon.format_title(label, entry.style, n=len(self.item_list) + 1)
         item.setLabel(label)
         return item
 
     def add(self, item, endpoint=None, folder=None):
         if item is not None:
-            self.item_list.append(Item(item, endpoint, folder))
+            if isinstance(item, ListItem):
+                get_prop = item.get_property
+            elif isinstance(item, xbmcgui.ListItem):
+                get_prop = item.getProperty
+            else:
+                get_prop = None  # just a title
+            self.item_list.append(Item(item, endpoint, folder, get_prop))
         return item
 
     def _prepare(self, item, endpoint=None, folder=None):
@@ -641,12 +871,13 @@ class AddonDirectory:
         elif isinstance(item, xbmcgui.ListItem):
             # pure kodi list item, create url from endpoint
             url, *_ = self.router.mkentry(item.getLabel(), endpoint)
-            if kodi_ver >= (20,):
+            if _KODI_GE_20:
                 ifolder = item.isFolder()
         else:
             # fallback, use "item" as title and create url from endpoint
-            title, url, style = self.router.mkentry(item, endpoint)
-            title = self.addon.format_title(title, style=style)
+            entry = self.router.mkentry(item, endpoint)
+            url = entry.url
+            title = self.addon.format_title(entry.title if entry.label is None else entry.label, style=entry.style)
             item = xbmcgui.ListItem(title)
         if folder is None:
             folder = ifolder
@@ -654,8 +885,8 @@ class AddonDirectory:
         return DirectoryItem(url, item, folder)
 
     def _add(self, item, endpoint=None, folder=None):
-        """Helper. Add item to xbmcplugin directory."""
-        return xbmcplugin.addDirectoryItem(*self._prepare(item, endpoint, folder=folder))
+        """Helper. Add single item to xbmcplugin directory. `close()` adds all items at once."""
+        return xbmcplugin.addDirectoryItem(self.addon.handle, *self._prepare(item, endpoint, folder=folder))
 
     def item(self, *args, **kwargs):
         """
@@ -834,6 +1065,8 @@ class AddonContextMenu(list):
     See: `xbmcgui.ListItem`.
     """
 
+    __slots__ = ('addon', )
+
     def __init__(self, *menus, addon):
         self.addon = addon
         for menu in menus:
@@ -856,7 +1089,8 @@ class AddonContextMenu(list):
 
     def add_items(self, menu):
         for item in menu or ():
-            if not isinstance(item, str) and isinstance(item, Sequence):
+            cls = item.__class__
+            if cls is tuple or cls is list or (cls is not str and isinstance(item, (tuple, list))):
                 # tuple: (title, handle) or (handle,)
                 self.add(*item[:2])
             else:
@@ -3,11 +3,14 @@ Some string and format tools.
 """
 
 import re
+import sys
 import string
-from inspect import isclass, currentframe
+import _string
+from inspect import isclass
 from dataclasses import dataclass
-from collections import namedtuple
+from collections import namedtuple, ChainMap
 from collections.abc import Mapping
+from functools import lru_cache
 from typing import (
     Optional, Union, Callable, Any, Type,
     List, Dict,
@@ -65,12 +68,21 @@ ESCAPE_TRANS = {
     '\v': '\\v',
     '\000': '\\000',
 }
+#: Translate table for string escape (`ESCAPE_TRANS` for str.translate()).
+ESCAPE_TABLE = str.maketrans(ESCAPE_TRANS)
 
 
 def str_escape(s):
     r"""Escape string, e.g. `\n` -> `\\n`."""
-    esc = ESCAPE_TRANS
-    return ''.join(esc.get(c, c) for c in s)
+    return s.translate(ESCAPE_TABLE)
+
+
+#: RegEx tokens for fparser() outside of a field: escaped brace, brace, literal text.
+_re_fparser_text = re.compile(r'\{\{|\}\}|[{}]|[^{}]+')
+#: RegEx tokens for fparser() inside a field: escaped brace, brace, separator, text, quoted string, single char.
+#: Text is tested before quotes (text never starts with a quote), quote pattern is tried on quote chars only.
+_re_fparser_field = re.compile(r'\{\{|\}\}|[{}!:]|[^{}!:\'"]+|(?=[\'"])(?P<quote>%s)|.' % re_quote.pattern,
+                               re.DOTALL)
 
 
 def fparser(s, *, eol_escape=False):
@@ -81,55 +93,67 @@ def fparser(s, *, eol_escape=False):
     >>> fmt('out: {", ".join(f"({x})" for x in hosts)}...', hosts=("a", "bb", "ccc"))
     >>> # 'out: (a), (bb), (ccc)'
     """
-    i, lvl = 0, 0
+    i, n, lvl = 0, len(s), 0
     # literal_text, field_name, format_spec, conversion
-    oi, vec = 0, ['', None, None, None]
-    while i < len(s):
-        c = s[i]
-        nc = s[i+1:i+2]
-        if c in '{}' and c == nc:
-            vec[oi] += c
-            i += 1
+    oi, vec, buf = 0, ['', None, None, None], []
+    while i < n:
+        m = (_re_fparser_field if lvl else _re_fparser_text).match(s, i)
+        i = m.end()
+        c = m.group()
+        if c == '{{' or c == '}}':
+            buf.append(c[0])
         elif c == '{':
             if lvl == 0:
-                oi = 1
+                vec[0] = ''.join(buf)
+                oi, buf = 1, []
                 vec[1] = vec[2] = ''
             else:
-                vec[oi] += c
+                buf.append(c)
             lvl += 1
         elif c == '}':
             lvl -= 1
             if lvl < 0:
                 raise ValueError("Single '}' encountered in format string")
             if lvl == 0:
+                vec[oi] = ''.join(buf)
                 yield vec
-                oi, vec = 0, ['', None, None, None]
+                oi, vec, buf = 0, ['', None, None, None], []
             else:
-                vec[oi] += c
+                buf.append(c)
         elif lvl == 1 and c == '!' and oi == 1:
-            oi = 3
-            vec[oi] = ''
+            vec[oi] = ''.join(buf)
+            oi, buf = 3, []
         elif lvl == 1 and c == ':' and oi in (1, 3):
-            oi = 2
-            vec[oi] = ''
+            vec[oi] = ''.join(buf)
+            oi, buf = 2, []
+        elif eol_escape and m.lastgroup == 'quote':
+            buf.append(c.replace('\n', '\\n'))
         else:
-            rx = re_quote.match(s, i) if lvl > 0 and c in ('"', "'") else None
-            if rx:
-                a, b = rx.span()
-                if eol_escape:
-                    vec[oi] += s[a:b].replace('\n', '\\n')
-                else:
-                    vec[oi] += s[a:b]
-                i += b - a - 1
-            else:
-                vec[oi] += c
-        i += 1
+            buf.append(c)
     if lvl:
         raise ValueError("Single '{' encountered in format string")
+    vec[0] = ''.join(buf)
     if vec[0] or vec[1] is not None:
         yield vec
 
 
+#: RegEx for simple format (no quotes, brackets, nested or escaped braces), fparser() is not needed.
+_re_simple_format = re.compile(r'(?:[^{}]|\{[^{}!:\'"\[]*(?:![a-z])?(?::[^{}\'"]*)?\})*')
+
+
+@lru_cache(maxsize=1024)
+def parse_format(format_string, *, extended=False):
+    """
+    Parse format string (once, result is cached), returns tuple of
+    (literal_text, field_name, format_spec, conversion).
+    If `extended` is true, fparser() is used.
+    """
+    if extended and not _re_simple_format.fullmatch(format_string):
+        return tuple(tuple(vec) for vec in fparser(format_string))
+    # simple format is parsed by fparser() exactly like by builtin (C) parser
+    return tuple(_string.formatter_parser(format_string))
+
+
 @dataclass
 class StylizeSettings:
     #: Default style.
@@ -199,16 +223,20 @@ class SafeFormatter(string.Formatter):
         self._field_name_stack: List[FieldInfo] = []
 
     def parse(self, format_string):
-        if self.extended:
-            return fparser(format_string)
-        return super().parse(format_string)
+        try:
+            return parse_format(format_string, extended=self.extended)  # cached
+        except ValueError:
+            # invalid format, parse lazy to keep the errors order (fields before format error)
+            if self.extended:
+                return fparser(format_string)
+            return super().parse(format_string)
 
     def vformat(self, format_string, args, kwargs):
+        if '{' not in format_string and '}' not in format_string:
+            return format_string  # nothing to format
         if self.evaluator_class:
             if self.evaluator_names:
-                names = {}
-                names.update(self.evaluator_names)
-                names.update(kwargs)
+                names = ChainMap(kwargs, self.evaluator_names)  # no copy, kwargs first
             else:
                 names = kwargs
             self.evaluator = self.evaluator_class(names=names, functions=self.evaluator_functions)
@@ -227,13 +255,15 @@ class SafeFormatter(string.Formatter):
         except IndexError:
             if not self.safe:
                 raise
-            value = '{%r}' % key
+            value = f'{{{key!r}}}'
         if self.raise_empty and not value:
             raise ValueError(f'{key!r} is not empty')
         return value
 
     def convert_field(self, value, conversion):
-        if self.escape and conversion == 'e':
+        if conversion is None:
+            return value  # most fields, no conversion
+        if conversion == 'e' and self.escape:
             return str_escape(str(value))
         # if conversion in '!?$':
         #     conversion = ''
@@ -255,7 +285,7 @@ class SafeFormatter(string.Formatter):
         return self.missing_field(field_name, args, kwargs)
 
     def missing_field(self, field_name, args, kwargs):
-        return '{%s}' % field_name, field_name
+        return f'{{{field_name}}}', field_name
 
     _RE_FORMAT_FIELD_EXTRA = re.compile(r'(?P<format_spec>.*?)(?P<conds>![$?].*?)?(?:!!(?P<default>.*))?')
     _RE_FORMAT_FIELD_SPLIT = re.compile(r'(![$?])')
@@ -343,7 +373,7 @@ class SafeFormatter(string.Formatter):
             return result
         except Exception:
             if self.safe:
-                return '{%r:%r}' % (value, input_spec)
+                return f'{{{value!r}:{input_spec!r}}}'
             raise
 
     def stylize(self,
@@ -432,20 +462,19 @@ def safefmt(fmt, *args, **kwargs):
     return SafeFormatter().vformat(fmt, args, kwargs)
 
 
+#: Functions available in vfstr() expressions.
+VFSTR_FUNCTIONS = {f.__name__: f for f in (
+    dir, vars,
+    str,
+)}
+
+
 def vfstr(fmt, args, kwargs, *, depth=1, extended=False):
     """Realize f-string formatting."""
-    frame = currentframe().f_back
-    for _ in range(depth):
-        frame = frame.f_back
-    data = {}
-    data.update(frame.f_globals)
-    data.update(frame.f_locals)
-    data.update(kwargs)
-    functions = {f.__name__: f for f in (
-        dir, vars,
-        str,
-    )}
-    return SafeFormatter(functions=functions, extended=extended).vformat(fmt, args, data)
+    frame = sys._getframe(depth + 1)  # caller frame (depth=0) or its `depth` parent
+    # no copy, look names up in kwargs, then locals, then globals
+    data = ChainMap(kwargs, frame.f_locals, frame.f_globals)
+    return SafeFormatter(functions=VFSTR_FUNCTIONS, extended=extended).vformat(fmt, args, data)
 
 
 def fstr(*args, **kwargs):
@@ -474,26 +503,28 @@ re_sectfmt_text = re.compile(r'[%\\]([][%\\])')
 def _vsectfmt(fmt, args, kwargs, *, formatter=None):
     """Realise Format in sections. See: sectfmt()."""
     def join(seq):
-        text = ''
+        buf = []
         for i, s in enumerate(seq):
-            if i % 2:
-                if s[0] == '[':
-                    yield False, text
-                    yield True, s[1:-1]
-                    text = ''
-                else:
-                    text += s
+            if i % 2 and s[0] == '[':
+                yield False, ''.join(buf)
+                yield True, s[1:-1]
+                buf = []
             else:
-                text += s
-        yield False, text
+                buf.append(s)
+        yield False, ''.join(buf)
 
+    seq = re_sectfmt_split.split(fmt)
+    if len(seq) == 1 and '{' not in fmt and '}' not in fmt:
+        return re_sectfmt_text.sub(r'\1', fmt)  # just a text, nothing to format
     if formatter is None:
         formatter = SafeFormatter(safe=False, raise_empty=True)
     try:
         parts = (_vsectfmt(text, args, kwargs, formatter=formatter) if sect
                  else formatter.vformat(re_sectfmt_text.sub(r'\1', text), args, kwargs)
-                 for sect, text in join(re_sectfmt_split.split(fmt)))
-        parts = (ss[1] for ss in neighbor_iter(parts, False) if all(s is not None for s in ss))
+                 for sect, text in join(seq))
+        # section with adjacent texts is skipped if any of them failed (is None)
+        parts = (cur for prev, cur, nxt in neighbor_iter(parts, False)
+                 if prev is not None and cur is not None and nxt is not None)
         return ''.join(parts)
     except (KeyError, AttributeError, ValueError, ValueError):
         return None
@@ -509,6 +540,7 @@ def vsectfmt(fmt, args, kwargs, *, allow_empty=False):
         If false (defualt), remove section if any value is empty
         If value doesn't exist section is removed always.
     """
+    # new formatter for each call, it keeps state while formatting (sectfmt() could be called from __format__)
     formatter = SafeFormatter(safe=False, raise_empty=not allow_empty)
     return _vsectfmt(fmt, args, kwargs, formatter=formatter) or ''
 
@@ -612,6 +644,12 @@ def stylize(text: str, style: Union[str, List[str]], *,
     return text
 
 
+@lru_cache(maxsize=512)
+def _compile_re(pattern: str, flags: int = 0) -> regex:
+    """Helper. Compile regex, cached (not limited by `re` module small cache)."""
+    return re.compile(pattern, flags)
+
+
 def find_re(pattern: Union[str, regex], text: str, default: str = '', flags: int = 0, many: bool = True) -> str:
     """
     Search regex pattern, return sub-expr(s) or whole found text or default.
@@ -625,13 +663,13 @@ def find_re(pattern: Union[str, regex], text: str, default: str = '', flags: int
     Ofcourse unnamed sub-expr (?:...) doesn't matter.
     """
     if not isinstance(pattern, regex):
-        pattern = re.compile(pattern, flags)
+        pattern = _compile_re(pattern, flags)
     rx = pattern.search(text)
-    if not rx:
+    if rx is None:
         return default
     groups = rx.groups()
     if not groups:
-        rx.group(0)
+        return rx.group(0)
     if len(groups) == 1 or not many:
         return groups[0]
     return groups
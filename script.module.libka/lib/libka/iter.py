@@ -23,9 +23,7 @@ def pairprev(iterable, fillvalue=None):
         yield fillvalue, next(b)
     except StopIteration:
         return
-    # yield from zip(a, b)
-    for x in zip(a, b):  # TODO: Remove this after drop PY2
-        yield x
+    yield from zip(a, b)
 
 
 def pairnext(iterable, fillvalue=None):
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import re
 from collections import namedtuple
+from functools import lru_cache
 import xbmc
 # traversal modules (ready to monkey-pathing)
 import xbmcvfs
@@ -13,13 +15,17 @@ import xbmcplugin
 version_info_type = namedtuple('version_info_type', 'major minor build')
 version_info_type.__new__.__defaults__ = 2*(0,)
 
+#: RegEx for Kodi build version, e.g. "20.2 (20.2.0) Git:..." or "21.0-ALPHA1 ...".
+_re_version = re.compile(r'(\d+)(?:\.(\d+))?(?:\.(\d+))?')
 
+
+@lru_cache(maxsize=1)
 def get_kodi_version_info():
     """Return major kodi version as int."""
     default = '19'
     ver = xbmc.getInfoLabel('System.BuildVersion') or default
-    ver = ver.partition(' ')[0].split('.', 3)[:3]
-    return version_info_type(*(int(v.partition('-')[0]) for v in ver))
+    m = _re_version.match(ver) or _re_version.match(default)
+    return version_info_type(*(int(v or 0) for v in m.groups()))
 
 
 version_info = get_kodi_version_info()
@@ -16,30 +16,33 @@ class LabelGetter:
     def __init__(self, id=None):
         self.id = id
         self.addon = Addon() if self.id is None else Addon(self.id)
+        #: Localized strings already taken from Kodi (they don't change in the session).
+        self._strings: Dict[int, str] = {}
 
     @overload
     def getter(self, id: int, string: str):
         ...
 
     @overload
-    def getter(self, id: int, string: str):
+    def getter(self, id: int):
+        ...
+
+    @overload
+    def getter(self, string: str):
         ...
 
-    def getter(self, *args):
+    def getter(self, sid, text=None):
         """
         L(). Get localized string. If there is no ID there string is returned without translation.
         """
-        if len(args) == 2:
-            sid, text = args
-        elif len(args) == 1:
-            if isinstance(args[0], int):
-                sid, text = args[0], None
-            else:
-                sid, text = None, args[0]
-        else:
-            raise TypeError(f'L{args} – incorrect arguments')
+        if text is None and not isinstance(sid, int):
+            return sid  # L(text)
         if sid:
-            return self.addon.getLocalizedString(sid)
+            try:
+                return self._strings[sid]
+            except KeyError:
+                string = self._strings[sid] = self.addon.getLocalizedString(sid)
+                return string
         return text
 
 
@@ -1,10 +1,66 @@
+import os
+import re
 import xbmc
+from xbmcvfs import translatePath
 from .format import vfstr
 
 
+#: Kodi debug logging is enabled, unknown (None) until first debug f-log (in current addon run).
+_debug_enabled = None
+
+#: Environment variable to force debug f-log on ("1") or off ("0"), ex. for `kodi --debug`.
+DEBUG_ENV = 'LIBKA_DEBUG'
+
+#: RegEx for log level in advancedsettings.xml.
+_re_loglevel = re.compile(r'<loglevel\b[^>]*>\s*(-?\d+)\s*</loglevel>')
+
+
+def _check_debug_enabled():
+    """Helper. Check if Kodi debug logging is enabled. Returns True if unknown."""
+    env = os.environ.get(DEBUG_ENV)
+    if env:
+        return env.lower() not in ('0', 'false', 'no', 'off')
+    try:
+        # debug logging enabled in GUI
+        if xbmc.getCondVisibility('System.GetBool(debug.showloginfo)'):
+            return True
+        # debug logging enabled in advancedsettings.xml (<loglevel>1</loglevel> or more)
+        try:
+            with open(translatePath('special://userdata/advancedsettings.xml'), encoding='utf-8') as f:
+                text = f.read()
+        except FileNotFoundError:
+            return False
+        rx = _re_loglevel.search(text)
+        return rx is not None and int(rx.group(1)) >= 1
+    except Exception:
+        return True  # never drop debug messages if the log level is unknown
+
+
+def is_debug_enabled():
+    """
+    Return True if Kodi debug logging is enabled (checked once per addon run).
+
+    Checks `DEBUG_ENV` environment variable, GUI setting and `<loglevel>` in advancedsettings.xml.
+    Kodi started with `--debug` could not be detected, use `LIBKA_DEBUG=1` then.
+    """
+    global _debug_enabled
+    if _debug_enabled is None:
+        _debug_enabled = _check_debug_enabled()
+    return _debug_enabled
+
+
+def reset_debug_enabled():
+    """Forget Kodi debug logging state, it is checked again on next debug f-log (new addon run)."""
+    global _debug_enabled
+    _debug_enabled = None
+
+
 def log(*msg, sep=' ', title=None, level=None):
     """XBMC log."""
-    msg = sep.join(map(str, msg))
+    if len(msg) == 1 and msg[0].__class__ is str:
+        msg = msg[0]  # most calls, just one text
+    else:
+        msg = sep.join(map(str, msg))
     # if isinstance(msg, bytes):
     #     msg = msg.decode('utf-8')
     # elif not isinstance(msg, str):
@@ -45,6 +101,8 @@ log.xdebug = log_xdebug
 
 def flog(msg, level=None, depth=0):
     """f-string formatted log."""
+    if level == xbmc.LOGDEBUG and not is_debug_enabled():
+        return  # Kodi drops debug messages anyway, skip formatting
     if isinstance(msg, bytes):
         msg = msg.decode('utf-8')
     msg = vfstr(msg, (), {}, depth=depth+1)
@@ -1,6 +1,7 @@
+import os
 from .base import LIBKA_ID
 from .path import Path
-from typing import Optional, Union, Dict
+from typing import Optional, Union, Dict, Set
 from xbmcvfs import translatePath
 from xbmcaddon import Addon as XbmcAddon
 
@@ -10,11 +11,17 @@ class Resources:
     Access do Addon resources.
     """
 
+    __slots__ = ('addon', '_base', '_path', '_media', '_exist_map')
+
+    #: Max number of paths in existence cache, the oldest ones are dropped.
+    EXIST_MAP_SIZE = 1024
+
     def __init__(self, addon, *, base: Optional[Union[Path, str]] = None):
         self.addon = addon
         self._base: Path = None if base is None else Path(base)
+        self._path: Path = None
         self._media: Media = None
-        self._exist_map: Dict[Path, bool] = {}
+        self._exist_map: Dict[str, bool] = {}
 
     @property
     def base(self):
@@ -26,7 +33,9 @@ class Resources:
     @property
     def path(self):
         """Path to resources folder."""
-        return self.base / 'resources'
+        if self._path is None:
+            self._path = self.base / 'resources'
+        return self._path
 
     @property
     def media(self):
@@ -35,15 +44,19 @@ class Resources:
             self._media = Media(self)
         return self._media
 
-    def exists(self, path):
-        if not isinstance(path, Path):
-            path = Path(path)
-        try:
-            return self._exist_map[path]
-        except KeyError:
-            exists = path.exists()
-            self._exist_map[path] = exists
-            return exists
+    def exists(self, path: Union[Path, str]) -> bool:
+        """Whether the path exists, result is cached (Path is str, any of them can be a key)."""
+        exist_map = self._exist_map
+        exists = exist_map.get(path)  # bool or None if not checked yet
+        if exists is None:
+            if os.path.isabs(path):
+                exists = os.path.exists(path)  # local path, skip VFS
+            else:
+                exists = Path(path).exists()
+            if len(exist_map) >= self.EXIST_MAP_SIZE:
+                del exist_map[next(iter(exist_map))]  # dict keeps insert order, drop the oldest
+            exist_map[path] = exists
+        return exists
 
 
 class Media:
@@ -51,8 +64,19 @@ class Media:
     Access do Addon resources media.
     """
 
+    __slots__ = ('resources', '_path', '_files', '_resolved', '_libka_media_path', '_transparent', '_black', '_white')
+
+    #: Image suffixes tried (in order) if image name is given without suffix.
+    _SUFFIXES = ('', '.png', '.jpg')
+    #: Known image suffixes, image name with one of them is used as is.
+    _IMAGE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.gif')
+
     def __init__(self, resources: Resources):
         self.resources: Resources = resources
+        self._path: Path = None
+        self._files: Set[str] = None
+        self._resolved: Dict[str, Optional[Path]] = {}
+        self._libka_media_path: Path = None
         self._transparent: Path = None
         self._black: Path = None
         self._white: Path = None
@@ -60,18 +84,64 @@ class Media:
     @property
     def path(self) -> Path:
         """Path to media folder."""
-        return self.resources.path / 'media'
+        if self._path is None:
+            self._path = self.resources.path / 'media'
+        return self._path
+
+    @staticmethod
+    def _file_key(path: str) -> str:
+        """Normalized path to find in `files`."""
+        return os.path.normcase(os.path.normpath(path))
+
+    @property
+    def files(self) -> Optional[Set[str]]:
+        """All files (normalized paths) in media folder (scanned once) or None if folder can not be listed."""
+        if self._files is None:
+            path = self.path
+            if os.path.isdir(path):
+                key = self._file_key
+                self._files = {key(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names}
+            else:
+                self._files = False  # not a local folder (or missing), check file by file
+        return None if self._files is False else self._files
 
     def image(self, name: str) -> Path:
-        """Get image path."""
-        path = self.path / name
-        for suffix in ('', '.png', '.jpg'):
-            p = path.with_suffix(suffix)
-            if self.resources.exists(p):
-                return p
+        """Get image path. Result (found path or None) is cached by `name`."""
+        try:
+            return self._resolved[name]
+        except KeyError:
+            pass
+        self._resolved[name] = path = self._find_image(name)
+        return path
+
+    def _find_image(self, name: str) -> Optional[Path]:
+        """Find image path, try all suffixes if `name` has no image suffix."""
+        if not name:
+            return None
+        path = os.path.join(self.path, name)
+        if name.lower().endswith(self._IMAGE_SUFFIXES):
+            candidates = (path,)
+        else:
+            candidates = tuple(path + suffix for suffix in self._SUFFIXES)
+        files = self.files
+        if files is not None:
+            key = self._file_key
+            for candidate in candidates:
+                if key(candidate) in files:
+                    return Path(candidate)
+        # not listed (ex. different case on case-insensitive filesystem), check file by file
+        exists = self.resources.exists
+        for candidate in candidates:
+            if exists(candidate):
+                return Path(candidate)
+        return None
 
     def libka_media_path(self) -> Path:
-        return Path(translatePath(XbmcAddon(LIBKA_ID).getAddonInfo('path'))) / 'resources' / 'media'
+        """Return path to libka media folder (translated once)."""
+        if self._libka_media_path is None:
+            path = Path(translatePath(XbmcAddon(LIBKA_ID).getAddonInfo('path')))
+            self._libka_media_path = path / 'resources' / 'media'
+        return self._libka_media_path
 
     @property
     def transparent(self) -> Path:
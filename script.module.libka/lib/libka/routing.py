@@ -1,6 +1,8 @@
 import sys
 import re
 import asyncio
+from functools import lru_cache
+from types import FunctionType
 from collections import namedtuple
 from collections.abc import Sequence, Mapping
 from inspect import (
@@ -23,7 +25,7 @@ from .logs import log
 from .utils import parse_url, encode_url
 from .url import URL
 from .types import (
-    remove_optional, bind_args,
+    remove_optional, bind_args, regex,
     uint, pint, mkbool,
     Args, KwArgs,
 )
@@ -117,6 +119,98 @@ def call(method, *args, **kwargs):
 
 ArgDescr = namedtuple('ArgDescr', 'type pattern')
 
+#: Empty dict, for attribute default (do NOT modify).
+_EMPTY_DICT: Dict[Any, Any] = {}
+
+#: Cache of global names: id(obj) -> name, verified on use.
+_global_names: Dict[int, str] = {}
+
+
+def _cache_key(func: Callable) -> Optional[Tuple[Callable, bool]]:
+    """
+    Return (function, is_bound) for cache or None if `func` should not be cached.
+
+    Bound methods are keyed by its function, to not keep instances (ex. addon) in caches.
+    Other callable objects are not cached at all.
+    """
+    if ismethod(func):
+        return func.__func__, True
+    if isfunction(func):
+        return func, False
+    return None
+
+
+@lru_cache(maxsize=1024)
+def _cached_signature(func: Callable, bound: bool) -> Signature:
+    sig = signature(func)
+    if bound:
+        # the same as bound method signature, skip the first argument ("self")
+        params = tuple(sig.parameters.values())
+        if not params or params[0].kind in (params[0].KEYWORD_ONLY, params[0].VAR_KEYWORD):
+            raise ValueError('invalid method signature')
+        if params[0].kind != params[0].VAR_POSITIONAL:
+            sig = sig.replace(parameters=params[1:])
+    return sig
+
+
+@lru_cache(maxsize=1024)
+def _cached_type_hints(func: Callable) -> Dict[str, Any]:
+    return get_type_hints(func)
+
+
+def _signature(func: Callable) -> Signature:
+    """Return `func` signature, cached for functions and methods. Returned signature is immutable."""
+    key = _cache_key(func)
+    if key is None:
+        return signature(func)
+    return _cached_signature(*key)
+
+
+def _type_hints(func: Callable) -> Dict[str, Any]:
+    """Return `func` type hints, cached for functions and methods. Do NOT modify returned dict."""
+    key = _cache_key(func)
+    if key is None:
+        return get_type_hints(func)
+    return _cached_type_hints(key[0])  # method has the same hints as its function
+
+
+def _scan_path_arg_plan(sig: Signature, hints: Dict[str, Any]) -> Tuple[Tuple[str, bool, bool], ...]:
+    """Return (name, is_path_arg, is_positional) for all PathArg and RawArg parameters in signature."""
+    plan = []
+    for p in sig.parameters.values():
+        ht = hints.get(p.name)
+        if PathArg.subtype(ht) is not None:
+            plan.append((p.name, True, p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)))
+        elif RawArg.subtype(ht) is not None:
+            plan.append((p.name, False, p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)))
+    return tuple(plan)
+
+
+@lru_cache(maxsize=1024)
+def _cached_path_arg_plan(func: Callable, bound: bool) -> Tuple[Tuple[str, bool, bool], ...]:
+    return _scan_path_arg_plan(_cached_signature(func, bound), _cached_type_hints(func))
+
+
+def _path_arg_plan(func: Callable) -> Tuple[Tuple[str, bool, bool], ...]:
+    """Return PathArg and RawArg parameters of `func` (see `_scan_path_arg_plan()`), cached like `_signature()`."""
+    key = _cache_key(func)
+    if key is None:
+        return _scan_path_arg_plan(signature(func), get_type_hints(func))
+    return _cached_path_arg_plan(*key)
+
+
+def _is_fixed_attr(obj: Any, name: str) -> bool:
+    """True if attribute `name` is `subobject` or method, it could not be changed by instance assignment."""
+    if name in getattr(obj, '__dict__', _EMPTY_DICT):
+        return False
+    for cls in type(obj).__mro__:
+        try:
+            attr = vars(cls)[name]
+        except KeyError:
+            continue
+        return isinstance(attr, (subobject, FunctionType, classmethod, staticmethod))
+    return False
+
 
 class Router:
     """
@@ -139,9 +233,20 @@ class Router:
 
     SAFE_CALL = False
 
+    #: Max number of objects in object path cache, the oldest ones are dropped.
+    OBJECT_PATH_CACHE_SIZE = 1024
+    #: Max number of paths in object cache, the oldest ones are dropped.
+    OBJECT_CACHE_SIZE = 512
+
     #: regex to find "<[type:]param>" in path.
     _RE_PATH_ARG = re.compile(r'<(?:(?P<type>\w+):)?(?P<name>[a-zA-Z]\w*|\d+)>')
 
+    #: regex to split object path (auto-path) to names.
+    _RE_OBJECT_PATH_SPLIT = re.compile(r'[/:.]')
+
+    #: regex to find named groups in route pattern (to build one regex for all routes).
+    _RE_NAMED_GROUP = re.compile(r'\(\?P<\w+>')
+
     _ARG_TYPES = {
         'str':    ArgDescr(str,    r'[^/]+'),
         'path':   ArgDescr(str,    r'.+'),
@@ -167,25 +272,70 @@ class Router:
             self.routes.extend(router.routes)
         #: Addon.
         self.addon = addon
+        #: Object path cache: id(obj) -> (obj, names), valid for `subobject.version`.
+        self._object_path_cache: Dict[int, Tuple[Any, List[str]]] = {}
+        self._object_path_version = subobject.version
+        #: Static routes (plain text path) map: path -> route.
+        self._static_routes: Dict[str, RouteEntry] = {}
+        #: Object cache: (path, strict) -> (obj, names), valid for `subobject.version`.
+        self._object_cache: Dict[Tuple[str, bool], Tuple[Any, List[str]]] = {}
+        self._object_cache_version = subobject.version
+        #: One regex for all non-static routes, each route is in "_N" group (N is route index).
+        self._routes_regex: Optional[regex] = None
+        #: Number of routes in `_static_routes` and `_routes_regex` (routes are only appended).
+        self._routes_size = 0
 
     def add_route(self, path: str, *, method: Callable, entry: EndpointEntry) -> None:
         """Add route (ex. from @entry)."""
-        def mkarg(r):
-            name = r['name']
-            typ = r['type'] or 'str'
-            typ = self._ARG_TYPES[typ]
-            if name.isdigit():
-                types[int(name)] = typ.type
-                name = f'_{name}'
-            else:
-                types[name] = typ.type
-            return fr'(?P<{name}>{typ.pattern})'
-
         if path is not None:
             path = getattr(path, 'path', path)  # EndpointEntry - dack typing
+            arg_types = self._ARG_TYPES
             types = {}
-            pattern = self._RE_PATH_ARG.sub(mkarg, path)
-            self.routes.append(RouteEntry(method, entry, re.compile(pattern), types))
+            parts = []
+            last = 0
+            for match in self._RE_PATH_ARG.finditer(path):
+                name = match['name']
+                typ = arg_types[match['type'] or 'str']
+                if name.isdigit():
+                    types[int(name)] = typ.type
+                    name = f'_{name}'
+                else:
+                    types[name] = typ.type
+                parts.append(path[last:match.start()])
+                parts.append(f'(?P<{name}>{typ.pattern})')
+                last = match.end()
+            parts.append(path[last:])
+            self.routes.append(RouteEntry(method, entry, re.compile(''.join(parts)), types))
+
+    def _update_routes(self) -> None:
+        """Build static routes map and one regex for all other routes (again if new routes are added)."""
+        routes = self.routes
+        if self._routes_size == len(routes):
+            return
+        sub = self._RE_NAMED_GROUP.sub
+        static, dynamic = {}, []
+        for i, route in enumerate(routes):
+            pattern = route.regex.pattern
+            if re.escape(pattern) == pattern:  # plain text path, no arguments and no regex
+                if pattern not in static:
+                    # the first matching route wins, it could be an earlier non-static route
+                    static[pattern] = next(r for r in routes[:i + 1] if r.regex.fullmatch(pattern))
+            else:
+                dynamic.append(f'(?P<_{i}>{sub("(?:", pattern)})')
+        self._static_routes = static
+        self._routes_regex = re.compile('|'.join(dynamic)) if dynamic else None
+        self._routes_size = len(routes)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _path_parts(path: str) -> Tuple[Union[str, Tuple[str, Optional[str]]], ...]:
+        """Split path to parts, "<[type:]param>" part is (name, type) tuple. Result is cached."""
+        match = Router._RE_PATH_ARG.fullmatch
+        parts = []
+        for part in path.split('/'):
+            m = '<' in part and match(part)
+            parts.append((m['name'], m['type']) if m else part)
+        return tuple(parts)
 
     @overload
     def mkentry(self, endpoint: Union[Callable, str], *,
@@ -244,68 +394,88 @@ class Router:
         return DirEntry(url, label, title, fmt)
 
     def _find_object_path(self, obj: Any) -> List[str]:
-        """Find object path (names) using `subobject` data."""
+        """Find object path (names) using `subobject` data. Result is cached until any `subobject` is set."""
+        cache = self._object_path_cache
+        if self._object_path_version != subobject.version:
+            cache.clear()
+            self._object_path_version = subobject.version
+        try:
+            cached, names = cache[id(obj)]
+        except KeyError:
+            pass
+        else:
+            if cached is obj:
+                return list(names)
+        names, fixed = self._scan_object_path(obj)
+        if names is not None and fixed:
+            if len(cache) >= self.OBJECT_PATH_CACHE_SIZE:
+                del cache[next(iter(cache))]  # dict keeps insert order, drop the oldest
+            cache[id(obj)] = (obj, names)  # keep obj reference, id() can not be reused
+            names = list(names)
+        return names
+
+    def _scan_object_path(self, obj: Any) -> Tuple[Optional[List[str]], bool]:
+        """
+        Find object path (names) using `subobject` data, see `_find_object_path()`.
+
+        Returns (names, fixed), path is `fixed` if found via `subobject` only (it could be cached).
+        """
         assert obj is not None
         names = []
-        while True:
-            # get object parent
-            try:
-                parent = obj._subobject_parent
-            except AttributeError:
-                break
-            if parent is None:
-                break
-            try:
-                # add object name (attribute in parent points to "obj")
-                names.insert(0, parent._subobject_objects[id(obj)])
-            except KeyError:
-                # missing "subobject", try to find object name ijn attributes
-                for k, v in vars(parent):
-                    if v is obj:
-                        names.insert(0, k)
-                        break
-                else:
-                    return None
+        fixed = True
+        # get object parent (None if there is no parent)
+        parent = getattr(obj, '_subobject_parent', None)
+        while parent is not None:
+            # add object name (attribute in parent points to "obj")
+            name = getattr(parent, '_subobject_objects', _EMPTY_DICT).get(id(obj))
+            if name is None:
+                # missing "subobject", try to find object name in attributes (could be changed any time)
+                name = next((k for k, v in vars(parent).items() if v is obj), None)
+                if name is None:
+                    return None, False
+                fixed = False
+            names.insert(0, name)
             obj = parent
+            parent = getattr(obj, '_subobject_parent', None)
         # find global name (first label in the path)
         if obj is not None and self.obj is None or obj is not self.obj:
             name = self._find_global(obj)
             if name:
                 names.insert(0, name)
-        return names
+                fixed = False  # global could be changed
+        return names, fixed
 
     def _find_global(self, obj: Any) -> str:
         """Find global object name for `obj`."""
         if obj is self.obj:
             return ':'
-        for k, v in globals().items():
-            if v is obj:
-                if self.obj is None:
-                    return k
-                return f':{k}'
+        dct = globals()
+        name = _global_names.get(id(obj))
+        if name is None or dct.get(name) is not obj:
+            name = next((k for k, v in dct.items() if v is obj), None)
+            if name is None:
+                return None
+            _global_names[id(obj)] = name
+        if self.obj is None:
+            return name
+        return f':{name}'
 
     def _make_path_args(self, endpoint: EndpointEntry, path_items: List[Any], params: KwArgs,
                         raw: Dict[str, Any]) -> None:
         """Add arguemnts to path (if PathArgs is used) and/or raw. Modify `path_items` & `raw."""
-        sig = signature(endpoint)
-        hints = get_type_hints(endpoint)
         count = 0
-        for p in sig.parameters.values():
-            ht = hints.get(p.name)
-            if PathArg.subtype(ht) is not None:
-                value = params.pop(p.name)
+        for name, is_path_arg, positional in _path_arg_plan(endpoint):
+            if is_path_arg:
+                value = params.pop(name)
                 if isinstance(value, SafeQuoteStr):
                     # Hack, allow extra characters in path (it breaks RFC).
                     value = value.as_url()
                 path_items.append(value)
-                if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
-                    params.pop(count, None)
-                    count += 1
-            elif RawArg.subtype(ht) is not None:
-                raw.setdefault('_', {})[p.name] = params.pop(p.name)
-                if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
-                    params.pop(count, None)
-                    count += 1
+            else:
+                raw.setdefault('_', {})[name] = params.pop(name)
+            if positional:
+                params.pop(count, None)
+                count += 1
 
     def mkurl(self, endpoint: Union[str, Callable], *args, **kwargs) -> str:
         """
@@ -396,12 +566,13 @@ class Router:
             path = f'/{endpoint}'
         # apply path args (from pattern)
         if isinstance(path, str):
-            path = path.split('/')
-        for i, part in enumerate(path):
-            if isinstance(part, str) and '<' in part:
-                match = self._RE_PATH_ARG.fullmatch(part)
-                if match:
-                    path[i] = fill_path_args(match['name'], match['type'])
+            path = [fill_path_args(*part) if type(part) is tuple else part for part in self._path_parts(path)]
+        else:
+            for i, part in enumerate(path):
+                if isinstance(part, str) and '<' in part:
+                    match = self._RE_PATH_ARG.fullmatch(part)
+                    if match:
+                        path[i] = fill_path_args(match['name'], match['type'])
         # reduce paramters: remove positional if keywoard exists, remove defaults arguments
         if arguments:
             npos = len(arguments.positional)
@@ -414,7 +585,28 @@ class Router:
     url_for = mkurl
 
     def _get_object(self, path, *, strict=True) -> Tuple[Callable, List[str]]:
-        """Return (object, args)."""
+        """Return (object, args). Result is cached until any `subobject` is set."""
+        cache = self._object_cache
+        if self._object_cache_version != subobject.version:
+            cache.clear()
+            self._object_cache_version = subobject.version
+        key = (path, strict)
+        try:
+            obj, names = cache[key]
+        except KeyError:
+            obj, names, fixed = self._scan_object(path, strict=strict)
+            if fixed:
+                if len(cache) >= self.OBJECT_CACHE_SIZE:
+                    del cache[next(iter(cache))]  # dict keeps insert order, drop the oldest
+                cache[key] = obj, names
+        return obj, list(names)
+
+    def _scan_object(self, path, *, strict=True) -> Tuple[Callable, List[str], bool]:
+        """
+        Return (object, args, fixed), see `_get_object()`.
+
+        Object is `fixed` if found via `subobject` and methods only (it could be cached).
+        """
         if path.startswith('/'):
             path = path[1:]
         if self.obj is None:
@@ -422,23 +614,26 @@ class Router:
         else:
             dct = None
         obj = self.obj
-        names = re.split(r'[/:.]', path)
+        names = self._RE_OBJECT_PATH_SPLIT.split(path)
         if obj is not None and len(names) <= 2 and not any(names):
-            return obj, []
+            return obj, [], True
+        fixed = True
         for i, name in enumerate(names):
             if not i and not name:
                 dct = globals()
             elif dct is not None:
                 obj = dct[name]
                 dct = None
+                fixed = False  # global could be changed
             else:
+                fixed = fixed and _is_fixed_attr(obj, name)
                 try:
                     obj = getattr(obj, name)
                 except AttributeError:
                     if strict:
                         raise
-                    return obj, names[i:]
-        return obj, []
+                    return obj, names[i:], fixed
+        return obj, [], fixed
 
     def _convert_args(self, method: Callable, args: Args, kwargs: KwArgs, *, sig: Signature) -> Call:
         """Convert method arguments based on annotations."""
@@ -475,15 +670,15 @@ class Router:
             return v
 
         if sig is None:
-            sig = signature(method)
+            sig = _signature(method)
         if all(p.annotation is p.empty for p in sig.parameters.values()):
             hints = {}  # the is no hints at all
         else:
             try:
-                hints = get_type_hints(method)
+                hints = _type_hints(method)
             except TypeError:
                 assert callable(method)
-                hints = get_type_hints(method.__call__)
+                hints = _type_hints(method.__call__)
         try:
             kwparam = next(iter(p for p in sig.parameters.values() if p.kind == p.VAR_KEYWORD))
         except StopIteration:
@@ -497,7 +692,7 @@ class Router:
         """
         Dispatcher helper. Find method args and kwargs.
         """
-        sig = signature(method)
+        sig = _signature(method)
         args = []
         i = 0
         for p in sig.parameters.values():
@@ -531,7 +726,7 @@ class Router:
         """Apply arguments by method singature and returns (args, kwargs)."""
         ait = iter(args)
         args = []
-        sig = signature(method)
+        sig = _signature(method)
         for i, p in enumerate(sig.parameters.values()):
             if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
                 try:
@@ -575,24 +770,31 @@ class Router:
         if raw:
             params.update(raw)
         # search in entry(path=)
-        for route in self.routes:
-            r = route.regex.fullmatch(url.path)
+        self._update_routes()
+        path = url.path
+        route = self._static_routes.get(path)
+        if route is None and self._routes_regex is not None:
+            r = self._routes_regex.fullmatch(path)
             if r:
-                for k, v in r.groupdict().items():
-                    if k[:1] == '_' and k[1:].isdigit():
-                        k = int(k[1:])
-                    params[k] = route.types[k](v)
-                return self._dispatcher_args(route.method, params, route.entry)
+                route = self.routes[int(r.lastgroup[1:])]  # matched "_N" group
+        if route is not None:
+            r = route.regex.fullmatch(path)  # route arguments
+            types = route.types
+            for k, v in r.groupdict().items():
+                if k[:1] == '_' and k[1:].isdigit():
+                    k = int(k[1:])
+                params[k] = types[k](v)
+            return self._dispatcher_args(route.method, params, route.entry)
         # detect root "/"
-        if root is not None and url.path == '/':
+        if root is not None and path == '/':
             return Call(root, (), {})
         # find object by auto-path
-        method, names = self._get_object(url.path, strict=False)
+        method, names = self._get_object(path, strict=False)
         if method is None:
             if missing is False:
                 return
             if missing is None:
-                raise ValueError(f'Missing handle for {url.path!r}')
+                raise ValueError(f'Missing handle for {path!r}')
             assert all(isinstance(k, str) for k in params)
             return Call(missing, tuple(names), params)
         # apply arguments
@@ -672,6 +874,9 @@ class Router:
 
 class subobject:
 
+    #: Changed on every subobject set or delete, invalidates cached object paths.
+    version = 0
+
     def __init__(self, method=None, *, name=None):
         self.method = method
         self.name = name
@@ -705,9 +910,11 @@ class subobject:
         if not hasattr(instance, '_subobject_parent'):
             instance._subobject_parent = None
         setattr(instance, f'_subobject_value_{self.name}', value)
+        subobject.version += 1
 
     def __delete__(self, instance):
         delattr(instance, f'_subobject_value_{self.name}')
+        subobject.version += 1
 
     def __set_name__(self, owner, name):
         self.name = name
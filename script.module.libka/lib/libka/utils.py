@@ -5,7 +5,7 @@ Author: rysson + stackoverflow
 """
 
 import re
-from sys import maxsize
+from sys import maxsize, intern
 from itertools import chain
 from urllib.parse import quote_plus
 from urllib.parse import parse_qsl
@@ -32,13 +32,14 @@ def parse_url(url: str, *, raw: Optional[Set[str]] = None) -> URL:
     Split URL into link (scheme, host, port...) and encoded query and fragment.
 
     `raw` are decoded (from pickle+gzip+base64).
+    Query keys are interned for fast dispatch lookups (keys are compared with method argument names).
     """
     url = URL(url)
     if raw is None:
         return url
 
     url.query  # access to query and buid URL._cache['query']
-    query = MultiDict(parse_qsl(url.raw_query_string, keep_blank_values=True))
+    query = MultiDict((intern(key), val) for key, val in parse_qsl(url.raw_query_string, keep_blank_values=True))
     for key, val in query.items():
         if key in raw:
             query[key] = decode_data(val)
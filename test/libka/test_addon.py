@@ -0,0 +1,35 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib' / '3rd'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib'))
+
+from libka.addon import AddonMixin  # noqa: E402
+from libka.resources import Resources  # noqa: E402
+
+
+class TestLazyProperties(TestCase):
+
+    def test_lazy(self):
+        addon = AddonMixin()
+        self.assertIsInstance(addon.resources, Resources)
+        self.assertIs(addon.resources, addon.resources)
+        self.assertIs(addon.xbmc_addon, addon.xbmc_addon)
+
+    def test_assign(self):
+        addon = AddonMixin()
+        resources, xbmc_addon = MagicMock(), MagicMock()
+        addon.resources = resources
+        addon.xbmc_addon = xbmc_addon
+        self.assertIs(addon.resources, resources)
+        self.assertIs(addon.xbmc_addon, xbmc_addon)
+
+    def test_assign_in_subclass(self):
+        class MyAddon(AddonMixin):
+            def __init__(self):
+                super().__init__()
+                self.resources = Resources(self, base='/tmp/my')
+
+        self.assertEqual(MyAddon().resources.base, '/tmp/my')
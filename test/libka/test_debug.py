@@ -0,0 +1,37 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib' / '3rd'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib'))
+
+from libka import debug  # noqa: E402
+from libka.debug import ListItem  # noqa: E402
+import xbmcgui  # noqa: E402
+
+
+class TestAddDirectoryItems(TestCase):
+
+    def log_items(self, items):
+        with patch.object(debug, 'klog') as klog, patch.object(debug, 'xbmcplugin_addDirectoryItems') as add:
+            debug.addDirectoryItems(3, items)
+        add.assert_called_once_with(handle=3, items=items, totalItems=0)
+        klog.info.assert_called_once()
+        return klog.info.call_args.args[0]
+
+    def test_label(self):
+        item = ListItem('Foo')
+        item.setLabel('Bar')
+        text = self.log_items([('plugin://this/foo', item, True), ('plugin://this/x', xbmcgui.ListItem('X'), False)])
+        self.assertIn("  ('plugin://this/foo', 'Bar', '/'),", text)
+        self.assertIn("  ('plugin://this/x', ", text)
+
+    def test_menu(self):
+        item = ListItem('Foo')
+        item.addContextMenuItems([('Refresh', 'Container.Refresh'), ('Play', 'RunPlugin(plugin://this/play)')])
+        text = self.log_items([('plugin://this/foo', item, False)])
+        self.assertIn(", menu=[\n", text)
+        self.assertIn("\n      ('Refresh', 'Container.Refresh'),", text)
+        self.assertIn("\n      ('Play', 'RunPlugin(plugin://this/play)')\n    ]", text)
+        self.assertNotIn('{', text)
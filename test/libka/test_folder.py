@@ -0,0 +1,126 @@
+import sys
+from pathlib import Path
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib' / '3rd'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib'))
+
+from libka import folder  # noqa: E402
+from libka.folder import AddonDirectory  # noqa: E402
+from libka.routing import Call, Router, entry  # noqa: E402
+
+
+class TestDefaultAddon(TestCase):
+
+    def test_current_addon(self):
+        addon = MagicMock(handle=5)
+        with patch.object(Call, 'addon', addon):
+            self.assertIs(AddonDirectory().addon, addon)
+
+    def test_next_addon(self):
+        # reused interpreter (reuselanguageinvoker), the next addon instance has new handle
+        first, second = MagicMock(handle=5), MagicMock(handle=9)
+        with patch.object(Call, 'addon', first):
+            self.assertIs(folder._get_default_addon(), first)
+        with patch.object(Call, 'addon', second):
+            kd = AddonDirectory()
+            self.assertIs(kd.addon, second)
+            self.assertEqual(kd.addon.handle, 9)
+
+    def test_module_addon(self):
+        addon, current = MagicMock(), MagicMock()
+        with patch.object(Call, 'addon', current), patch.object(folder, 'addon', addon, create=True):
+            self.assertIs(folder._get_default_addon(), addon)
+        with patch.object(Call, 'addon', current):
+            self.assertIs(folder._get_default_addon(), current)
+
+
+class TestInternalSort(TestCase):
+
+    def sorted_labels(self, isort, infos):
+        kd = AddonDirectory(addon=MagicMock(), isort=isort, sort=False)
+        for label, info in infos:
+            item = folder.ListItem(label, url=f'plugin://test/{label}', type='video', custom=label)
+            item.set_info(info)
+            kd.add(item)
+        kd.close()
+        return [it.item.custom for it in kd.item_list]
+
+    def test_numbers(self):
+        infos = [('a', {'year': 2001}), ('b', {'year': 1999.5}), ('c', {}), ('d', {'year': 2000})]
+        self.assertEqual(self.sorted_labels('year', infos), ['c', 'b', 'd', 'a'])
+        self.assertEqual(self.sorted_labels('-year', infos), ['a', 'd', 'b', 'c'])
+
+    def test_mixed_types(self):
+        infos = [('a', {'genre': 'x'}), ('b', {'genre': 10}), ('c', {'genre': 2})]
+        self.assertEqual(self.sorted_labels('genre', infos), ['b', 'c', 'a'])  # as str: '10' < '2' < 'x'
+
+    def test_mixed_list_items(self):
+        # the same type (list) but not comparable items, compared as str
+        infos = [('a', {'genre': ['a']}), ('b', {'genre': [1]}), ('c', {'genre': ['b', 2]})]
+        # as str: "['a']" < "['b', 2]" < "[1]"
+        self.assertEqual(self.sorted_labels('genre', infos), ['a', 'c', 'b'])
+        self.assertEqual(self.sorted_labels('-genre', infos), ['b', 'c', 'a'])
+
+    def test_mixed_list_items_multi_field(self):
+        infos = [('a', {'genre': ['a'], 'year': 2}),
+                 ('b', {'genre': [1], 'year': 1}),
+                 ('c', {'genre': ['a'], 'year': 1})]
+        self.assertEqual(self.sorted_labels('genre,year', infos), ['c', 'a', 'b'])
+
+
+class TestItemFormat(TestCase):
+
+    def new(self, title=None):
+        addon = MagicMock()
+        addon.router.mkentry.return_value = MagicMock(label='Name', title=title, style=None)
+        addon.format_title.side_effect = lambda label, style, n=None: label
+        kd = AddonDirectory(addon=addon, format='{} ({year})')
+        return kd.new('Name', 'plugin://test/name', info={'year': 2001}, title=title)
+
+    def test_label(self):
+        item = self.new()
+        self.assertEqual(item.get_info('title'), None)
+        self.assertEqual(item.label, 'Name (2001)')
+
+    def test_title(self):
+        item = self.new(title='Title')
+        self.assertEqual(item.get_info('title'), 'Title (2001)')
+        self.assertEqual(item.label, 'Name (2001)')
+
+
+@entry(path='/play')
+def play(vid: int = 0):
+    pass
+
+
+class TestSingleItem(TestCase):
+
+    def setUp(self):
+        addon = MagicMock(handle=7)
+        addon.router = Router('plugin://this', standalone=True)
+        addon.format_title.side_effect = lambda label, style=None, n=None: f'[{label}]'
+        self.kd = AddonDirectory(addon=addon)
+
+    def test_prepare_title(self):
+        # fallback, just title, url from endpoint
+        url, item, is_folder = self.kd._prepare('Play it', play)
+        self.assertEqual(url, 'plugin://this/play')
+        self.assertIsInstance(item, folder.xbmcgui.ListItem)
+        self.assertFalse(is_folder)
+        self.kd.addon.format_title.assert_called_once_with('Play it', style=None)
+
+    def test_prepare_title_folder(self):
+        url, item, is_folder = self.kd._prepare('Play it', play, folder=True)
+        self.assertEqual(url, 'plugin://this/play')
+        self.assertTrue(is_folder)
+
+    def test_add(self):
+        with patch.object(folder.xbmcplugin, 'addDirectoryItem') as mock:
+            self.kd._add('Play it', play, folder=True)
+        mock.assert_called_once()
+        handle, url, item, is_folder = mock.call_args.args
+        self.assertEqual(handle, 7)
+        self.assertEqual(url, 'plugin://this/play')
+        self.assertTrue(is_folder)
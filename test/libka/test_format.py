@@ -0,0 +1,78 @@
+import re
+import sys
+from pathlib import Path
+from unittest import TestCase, skipIf
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib' / '3rd'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib'))
+
+from libka import format as libka_format  # noqa: E402
+from libka.format import SafeFormatter, parse_format, find_re, sectfmt  # noqa: E402
+
+
+class TestSafeFormatterParse(TestCase):
+
+    def test_parse_cached(self):
+        # format string is parsed once, shared by all formatters
+        self.assertIs(SafeFormatter().parse('{a} {b!r:>3}'), SafeFormatter().parse('{a} {b!r:>3}'))
+        self.assertIs(SafeFormatter().parse('{a}'), parse_format('{a}', extended=False))
+
+    def test_extended_parse_cached(self):
+        fmt = SafeFormatter(extended=True)
+        self.assertIs(fmt.parse('{a[1]:x}'), fmt.parse('{a[1]:x}'))
+        self.assertIs(fmt.parse('{a}'), parse_format('{a}', extended=True))
+
+    def test_format(self):
+        fmt = SafeFormatter()
+        for _ in range(2):
+            self.assertEqual(fmt.format('{a}-{b}', a=1, b=2), '1-2')
+            self.assertEqual(fmt.format('{a}-{b}', a=1), '1-{b}')
+
+
+class TestFindRe(TestCase):
+
+    def test_no_groups(self):
+        self.assertEqual(find_re(r'\d+', 'abc 123 def'), '123')
+        self.assertEqual(find_re(r'(?:a|b)c', 'xbc'), 'bc')
+        self.assertEqual(find_re(re.compile(r'\d+'), 'abc 123'), '123')
+
+    def test_groups(self):
+        self.assertEqual(find_re(r'(\d+)-\d+', 'x 12-34'), '12')
+        self.assertEqual(find_re(r'(\d+)-(\d+)', 'x 12-34'), ('12', '34'))
+        self.assertEqual(find_re(r'(\d+)-(\d+)', 'x 12-34', many=False), '12')
+
+    def test_default(self):
+        self.assertEqual(find_re(r'\d+', 'abc'), '')
+        self.assertIsNone(find_re(r'\d+', 'abc', default=None))
+        self.assertEqual(find_re(r'x*', 'abc', default=None), '')  # empty match is found
+
+
+class Inner:
+
+    def __format__(self, spec):
+        return sectfmt('[<{z}>]', z='inner')
+
+
+class Broken:
+
+    def __format__(self, spec):
+        raise TypeError('broken')
+
+
+class TestSectFmt(TestCase):
+
+    def test_sections(self):
+        self.assertEqual(sectfmt('[a={a}], [b={b}][: ][c={c}], [{a}/{c}]', a=42), 'a=42: ')
+
+    def test_nested(self):
+        # sectfmt() called from __format__ while formatting
+        self.assertEqual(sectfmt('[{v} {a}]', v=Inner(), a=1), '<inner> 1')
+
+    @skipIf(libka_format.simple_eval is None, 'simpleeval is missing')
+    def test_nested_expression(self):
+        self.assertEqual(sectfmt('[{v} {a+1}]', v=Inner(), a=1), '<inner> 2')
+
+    def test_exception(self):
+        with self.assertRaises(TypeError):
+            sectfmt('[{w}]', w=Broken())
+        self.assertEqual(sectfmt('[{a}]', a=1), '1')
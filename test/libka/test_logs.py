@@ -0,0 +1,100 @@
+import os
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib' / '3rd'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib'))
+
+import xbmc  # noqa: E402
+from libka import logs  # noqa: E402
+from libka.addon import AddonMixin  # noqa: E402
+
+
+class DebugTestCase(TestCase):
+
+    def setUp(self):
+        env = patch.dict(os.environ)
+        env.start()
+        self.addCleanup(env.stop)
+        os.environ.pop(logs.DEBUG_ENV, None)
+        logs.reset_debug_enabled()
+        self.addCleanup(logs.reset_debug_enabled)
+
+
+class TestDebugEnabled(DebugTestCase):
+
+    def test_checked_once(self):
+        with patch('xbmc.getCondVisibility', return_value=True) as mock:
+            self.assertTrue(logs.is_debug_enabled())
+            self.assertTrue(logs.is_debug_enabled())
+            mock.assert_called_once_with('System.GetBool(debug.showloginfo)')
+
+    def test_reset(self):
+        with patch('xbmc.getCondVisibility', return_value=True):
+            self.assertTrue(logs.is_debug_enabled())
+        with patch('xbmc.getCondVisibility', return_value=False):
+            self.assertTrue(logs.is_debug_enabled())  # still cached
+            logs.reset_debug_enabled()
+            self.assertFalse(logs.is_debug_enabled())
+
+    def test_new_addon_run(self):
+        # reused interpreter (reuselanguageinvoker), user changed debug logging between addon runs
+        with patch('xbmc.getCondVisibility', return_value=False):
+            self.assertFalse(logs.is_debug_enabled())
+        with patch('xbmc.getCondVisibility', return_value=True):
+            AddonMixin()
+            self.assertTrue(logs.is_debug_enabled())
+
+    def test_env(self):
+        for value, enabled in (('1', True), ('yes', True), ('0', False), ('off', False)):
+            with self.subTest(value=value):
+                os.environ[logs.DEBUG_ENV] = value
+                logs.reset_debug_enabled()
+                with patch('xbmc.getCondVisibility', return_value=not enabled) as mock:
+                    self.assertIs(logs.is_debug_enabled(), enabled)
+                    mock.assert_not_called()
+
+    def test_advanced_settings(self):
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'advancedsettings.xml')
+            translate = patch.object(logs, 'translatePath', return_value=path)
+            with patch('xbmc.getCondVisibility', return_value=False), translate:
+                self.assertFalse(logs.is_debug_enabled())  # missing file
+                for level, enabled in (('1', True), ('2', True), ('0', False), ('-1', False)):
+                    with self.subTest(level=level):
+                        with open(path, 'w') as f:
+                            f.write(f'<advancedsettings>\n  <loglevel hide="false">{level}</loglevel>\n'
+                                    '</advancedsettings>')
+                        logs.reset_debug_enabled()
+                        self.assertIs(logs.is_debug_enabled(), enabled)
+
+    def test_fail_open(self):
+        with patch('xbmc.getCondVisibility', side_effect=RuntimeError):
+            self.assertTrue(logs.is_debug_enabled())
+
+
+class TestFLog(DebugTestCase):
+
+    def test_debug_disabled(self):
+        with patch('xbmc.getCondVisibility', return_value=False), patch.object(logs, 'vfstr') as vfstr, \
+                patch('xbmc.log') as log:
+            logs.flog('x={x}', xbmc.LOGDEBUG)
+            logs.flog.debug('x={x}')
+        vfstr.assert_not_called()
+        log.assert_not_called()
+
+    def test_debug_enabled(self):
+        x = 42  # noqa: F841
+        with patch('xbmc.getCondVisibility', return_value=True), patch('xbmc.log') as log:
+            logs.flog('x={x}', xbmc.LOGDEBUG)
+            logs.flog.debug('x={x}')
+        self.assertEqual(log.call_args_list, [(('x=42', xbmc.LOGDEBUG),)] * 2)
+
+    def test_info(self):
+        x = 42  # noqa: F841
+        with patch('xbmc.getCondVisibility', return_value=False), patch('xbmc.log') as log:
+            logs.flog('x={x}', xbmc.LOGINFO)
+        log.assert_called_once_with('x=42', xbmc.LOGINFO)
@@ -0,0 +1,71 @@
+import os
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib' / '3rd'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib'))
+
+from libka.resources import Resources  # noqa: E402
+
+
+class TestMediaImage(TestCase):
+
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.media = os.path.join(self.tmp.name, 'resources', 'media')
+        os.makedirs(os.path.join(self.media, 'default'))
+        for name in ('default/icon.png', 'fan.jpg', 'logo.gif', 'both.png', 'both.jpg'):
+            with open(os.path.join(self.media, name), 'wb'):
+                pass
+        self.resources = Resources(None, base=self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def image(self, name):
+        path = self.resources.media.image(name)
+        return None if path is None else os.path.relpath(path, self.media).replace(os.sep, '/')
+
+    def test_suffixes(self):
+        self.assertEqual(self.image('default/icon'), 'default/icon.png')
+        self.assertEqual(self.image('fan'), 'fan.jpg')
+        self.assertEqual(self.image('both'), 'both.png')
+        self.assertIsNone(self.image('missing'))
+        self.assertIsNone(self.image(''))
+
+    def test_explicit_suffix(self):
+        self.assertEqual(self.image('fan.jpg'), 'fan.jpg')
+        self.assertEqual(self.image('logo.gif'), 'logo.gif')
+        self.assertEqual(self.image('both.jpg'), 'both.jpg')
+        self.assertIsNone(self.image('fan.png'))  # explicit suffix is not replaced
+
+    def test_not_normalized(self):
+        self.assertEqual(self.image('./fan.jpg'), 'fan.jpg')
+        self.assertEqual(self.image('default//icon'), 'default/icon.png')
+        self.assertEqual(self.image('default/../fan.jpg'), 'fan.jpg')
+        self.assertEqual(self.image(f'default{os.sep}icon'), 'default/icon.png')
+
+    def test_not_listed(self):
+        # ex. different case on case-insensitive filesystem, resources.exists() decides
+        logo = os.path.join(self.media, 'Logo.png')
+        with patch.object(Resources, 'exists', side_effect=lambda path: path == logo) as mock:
+            self.assertEqual(self.image('Logo'), 'Logo.png')
+            mock.assert_called()
+
+    def test_cached_by_name(self):
+        self.assertIsNone(self.image('late'))
+        with open(os.path.join(self.media, 'late.png'), 'wb'):
+            pass
+        with patch.object(Resources, 'exists') as mock:
+            self.assertIsNone(self.image('late'))  # found or not, result is cached
+            mock.assert_not_called()
+
+    def test_not_local_folder(self):
+        resources = Resources(None, base=os.path.join(self.tmp.name, 'missing'))
+        self.assertIsNone(resources.media.files)
+        with patch.object(Resources, 'exists', return_value=True) as mock:
+            self.assertEqual(resources.media.image('x'), os.path.join(resources.media.path, 'x'))
+            mock.assert_called_once()
@@ -0,0 +1,141 @@
+import gc
+import sys
+import weakref
+from inspect import signature
+from pathlib import Path
+from unittest import TestCase
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib' / '3rd'))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / 'script.module.libka' / 'lib'))
+
+from libka import routing  # noqa: E402
+from libka.routing import Router, PathArg, RawArg, subobject  # noqa: E402
+
+
+class Obj:
+
+    def meth(self, a: PathArg[int], /, b: int = 2, *args, c: RawArg[dict] = None, **kwargs):
+        pass
+
+    def varargs(*args):
+        pass
+
+    @classmethod
+    def cmeth(cls, x: int):
+        pass
+
+    @staticmethod
+    def smeth(y):
+        pass
+
+
+class TestSignatureCache(TestCase):
+
+    def test_signature(self):
+        obj = Obj()
+        for func in (obj.meth, obj.varargs, obj.cmeth, Obj.cmeth, obj.smeth, Obj.meth, len):
+            with self.subTest(func=func):
+                self.assertEqual(routing._signature(func), signature(func))
+                self.assertEqual(routing._signature(func), signature(func))  # cached
+
+    def test_path_arg_plan(self):
+        self.assertEqual(routing._path_arg_plan(Obj().meth), (('a', True, True), ('c', False, False)))
+        self.assertEqual(routing._path_arg_plan(Obj.meth), (('a', True, True), ('c', False, False)))
+
+    def test_instance_is_not_kept(self):
+        obj = Obj()
+        ref = weakref.ref(obj)
+        routing._signature(obj.meth)
+        routing._type_hints(obj.meth)
+        routing._path_arg_plan(obj.meth)
+        del obj
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class Leaf:
+
+    def __init__(self, tag):
+        self.tag = tag
+
+    def show(self, a: int = 0):
+        return self.tag, a
+
+
+class Branch:
+
+    def __init__(self):
+        self.plain = Leaf('plain')  # not a subobject
+        self.plain._subobject_parent = self
+
+    @subobject
+    def sub(self):
+        return Leaf('sub')
+
+
+class TestObjectCache(TestCase):
+
+    def setUp(self):
+        self.root = Branch()
+        self.router = Router('plugin://this', obj=self.root, standalone=True)
+
+    def dispatch(self, path):
+        return self.router.sync_dispatch(f'plugin://this{path}')
+
+    def test_subobject(self):
+        self.assertEqual(self.dispatch('/sub/show?a=1'), ('sub', 1))
+        self.assertEqual(self.router.mkurl(self.root.sub.show, 2), 'plugin://this/sub/show?a=2')
+        version = subobject.version
+        self.root.sub = Leaf('new')
+        self.assertNotEqual(subobject.version, version)
+        self.assertEqual(self.dispatch('/sub/show?a=1'), ('new', 1))
+        self.assertEqual(self.router.mkurl(self.root.sub.show, 2), 'plugin://this/sub/show?a=2')
+
+    def test_subobject_delete(self):
+        sub = self.router._get_object('/sub')[0]
+        self.assertIs(sub, self.root.sub)
+        version = subobject.version
+        del self.root.sub
+        self.assertNotEqual(subobject.version, version)
+        self.assertIsNot(self.router._get_object('/sub')[0], sub)  # created again on demand
+        self.assertIs(self.router._get_object('/sub')[0], self.root.sub)
+
+    def test_plain_attribute(self):
+        # plain attribute could be reassigned without any notification, it is never cached
+        self.assertEqual(self.dispatch('/plain/show?a=1'), ('plain', 1))
+        self.root.plain = Leaf('new')
+        self.assertEqual(self.dispatch('/plain/show?a=1'), ('new', 1))
+
+    def test_plain_attribute_path(self):
+        # fixed "vars(parent)" fallback (object is not a subobject)
+        self.assertEqual(self.router.mkurl(self.root.plain.show, 3), 'plugin://this/plain/show?a=3')
+        leaf = self.root.plain
+        self.root.other = leaf
+        del self.root.plain
+        self.assertEqual(self.router.mkurl(leaf.show, 3), 'plugin://this/other/show?a=3')
+
+
+class TestObjectPath(TestCase):
+
+    def setUp(self):
+        self.root = Branch()
+        self.router = Router('plugin://this', obj=self.root, standalone=True)
+
+    def test_subobject(self):
+        self.assertEqual(self.router._find_object_path(self.root.sub), ['sub'])
+
+    def test_plain_attribute(self):
+        # object is not a subobject, name is found in parent attributes
+        self.assertEqual(self.router._find_object_path(self.root.plain), ['plain'])
+
+    def test_nested_plain_attribute(self):
+        leaf = Leaf('deep')
+        leaf._subobject_parent = self.root.plain
+        self.root.plain.deep = leaf
+        self.assertEqual(self.router._find_object_path(leaf), ['plain', 'deep'])
+        self.assertEqual(self.router.mkurl(leaf.show, 1), 'plugin://this/plain/deep/show?a=1')
+
+    def test_missing_attribute(self):
+        leaf = Leaf('lost')
+        leaf._subobject_parent = self.root  # parent does not point to it
+        self.assertIsNone(self.router._find_object_path(leaf))